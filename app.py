@@ -6,13 +6,13 @@ A Streamlit application for exploring tax parcels and property ownership in Lane
 import streamlit as st
 import pandas as pd
 import numpy as np
-import folium
-from folium.plugins import Draw, MousePosition, Fullscreen, LocateControl
 import streamlit.components.v1 as components
 import json
 from pathlib import Path
 import random
 from constants import DEFAULT_DATA_FILE
+from utils.jsonio import load_file
+from ui import prepare_search_columns, use_arrow_strings
 
 # Page configuration
 st.set_page_config(
@@ -151,6 +151,17 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Rows sent to the browser for the results table unless "Show all" is ticked
+RESULTS_PREVIEW_ROWS = 200
+
+# Text columns searched case-insensitively by the sidebar search box; each
+# gets a lowercased `_<column>_lc` sidecar when the data is loaded
+APP_SEARCH_COLUMNS = ('owner', 'mailing_address')
+
+# Low-cardinality text columns stored as categoricals, so equality and isin
+# filters compare integer codes instead of strings
+CATEGORY_COLUMNS = ('municipality', 'property_class_desc')
+
 
 @st.cache_data
 def load_parcel_data(num_parcels: int = 500):
@@ -168,8 +179,7 @@ def load_parcel_data(num_parcels: int = 500):
     # Try to load real data first
     if data_file.exists():
         try:
-            with open(data_file, "r") as f:
-                data = json.load(f)
+            data = load_file(data_file)
             df = pd.DataFrame(data)
             
             # Validate required columns exist
@@ -178,12 +188,11 @@ def load_parcel_data(num_parcels: int = 500):
                 # Clean up any NaN values in critical columns
                 df = df.dropna(subset=['latitude', 'longitude'])
                 
-                # Ensure coordinates column exists
+                # Ensure coordinates column exists (rows without a centroid were dropped above)
                 if 'coordinates' not in df.columns:
-                    df['coordinates'] = df.apply(
-                        lambda r: [[r['latitude'], r['longitude']]] if pd.notna(r['latitude']) else [],
-                        axis=1
-                    )
+                    df['coordinates'] = [
+                        [[lat, lon]] for lat, lon in zip(df['latitude'], df['longitude'])
+                    ]
                 
                 # Ensure all required columns have values
                 df['owner'] = df['owner'].fillna('Unknown')
@@ -195,12 +204,43 @@ def load_parcel_data(num_parcels: int = 500):
                 df['annual_taxes'] = df.get('annual_taxes', df['assessed_value'] * 0.025)
                 
                 if len(df) > 0:
+                    df['_pc_lead'] = get_property_class_lead(df['property_class'])
+                    df = df.astype({col: 'category' for col in CATEGORY_COLUMNS if col in df.columns})
+                    df = prepare_search_columns(use_arrow_strings(df), APP_SEARCH_COLUMNS)
+                    # Lets the sidebar tell real data apart without re-reading the file
+                    df.attrs['is_real_data'] = True
+                    # Cheap content key (file mtime + size) for caches keyed on the
+                    # dataset, so they don't hash the frame on every rerun
+                    stat = data_file.stat()
+                    df.attrs['data_version'] = f"{stat.st_mtime_ns}-{stat.st_size}"
                     return df
         except Exception as e:
             print(f"Error loading cached data: {e}")
     
     # Fall back to sample data generation
-    return generate_sample_data(num_parcels)
+    df = generate_sample_data(num_parcels)
+    df['_pc_lead'] = get_property_class_lead(df['property_class'])
+    df = df.astype({col: 'category' for col in CATEGORY_COLUMNS})
+    df.attrs['data_version'] = f"sample-{num_parcels}"
+    return prepare_search_columns(use_arrow_strings(df), APP_SEARCH_COLUMNS)
+
+
+@st.cache_data(show_spinner=False)
+def get_owner_portfolio(num_parcels: int = 500) -> pd.DataFrame:
+    """Per-owner totals (acreage, assessed value, parcel count)
+    
+    Aggregated once per dataset load instead of on every rerun; the data
+    refresh buttons clear it along with the parcel cache.
+    
+    Args:
+        num_parcels: Passed through to load_parcel_data
+    """
+    df = load_parcel_data(num_parcels)
+    return df.groupby('owner').agg({
+        'acreage': 'sum',
+        'assessed_value': 'sum',
+        'parcel_id': 'count'
+    }).rename(columns={'parcel_id': 'parcel_count'})
 
 
 def generate_sample_data(num_parcels: int = 500) -> pd.DataFrame:
@@ -352,22 +392,44 @@ def generate_sample_data(num_parcels: int = 500) -> pd.DataFrame:
     return pd.DataFrame(parcels)
 
 
-def get_parcel_color(property_class):
-    """Return color based on property classification"""
-    class_colors = {
-        "2": "#4CAF50",   # Residential - Green
-        "3": "#FFC107",   # Vacant Land - Yellow
-        "9": "#2196F3",   # State/Forest - Blue
-        "1": "#8BC34A",   # Agricultural - Light Green
-        "4": "#FF5722",   # Commercial - Orange
-        "5": "#9C27B0",   # Recreation - Purple
-        "6": "#607D8B",   # Community Service - Gray
-    }
-    return class_colors.get(property_class[0], "#757575")
+# Parcel colors keyed on the leading digit of the property class
+PARCEL_COLORS = pd.Series({
+    "2": "#4CAF50",   # Residential - Green
+    "3": "#FFC107",   # Vacant Land - Yellow
+    "9": "#2196F3",   # State/Forest - Blue
+    "1": "#8BC34A",   # Agricultural - Light Green
+    "4": "#FF5722",   # Commercial - Orange
+    "5": "#9C27B0",   # Recreation - Purple
+    "6": "#607D8B",   # Community Service - Gray
+})
+DEFAULT_PARCEL_COLOR = "#757575"
+
+
+def get_property_class_lead(property_classes):
+    """Leading digit of each property class as a categorical (e.g. '2' = residential)
+    
+    Stored on the loaded data as the internal `_pc_lead` column so class
+    filters compare category codes instead of slicing strings per row.
+    Underscore-prefixed columns are dropped from exports.
+    """
+    return property_classes.astype(str).str[:1].astype('category')
+
+
+def export_columns(df):
+    """Return df without internal (underscore-prefixed) helper columns"""
+    return df.loc[:, ~df.columns.str.startswith('_')]
+
+
+def get_parcel_colors(class_leads):
+    """Return a color per parcel from the leading property class digit (vectorized)"""
+    return class_leads.map(PARCEL_COLORS).fillna(DEFAULT_PARCEL_COLOR)
 
 
 def create_map(df, selected_parcel=None, show_labels=True, map_style="satellite"):
     """Create the interactive Folium map"""
+    # Imported here so pages that only reuse load_parcel_data skip folium
+    import folium
+    from folium.plugins import Draw, MousePosition, Fullscreen, LocateControl
     
     # Handle empty dataframe - default to Lanesville center
     if df.empty or df['latitude'].isna().all():
@@ -425,13 +487,19 @@ def create_map(df, selected_parcel=None, show_labels=True, map_style="satellite"
     state_group = folium.FeatureGroup(name="🏛️ State/Public", show=True)
     other_group = folium.FeatureGroup(name="📍 Other", show=True)
     
-    for _, row in df.iterrows():
-        color = get_parcel_color(row['property_class'])
-        is_selected = selected_parcel and row['parcel_id'] == selected_parcel
+    if '_pc_lead' in df.columns:
+        class_leads = df['_pc_lead']
+    else:
+        class_leads = get_property_class_lead(df['property_class'])
+    colors = get_parcel_colors(class_leads).to_numpy()
+    
+    # Plain namedtuples - avoids boxing every row into a Series
+    for row, color, prop_class in zip(df.itertuples(index=False), colors, class_leads):
+        is_selected = selected_parcel and row.parcel_id == selected_parcel
         
         # Create polygon for parcel
         polygon = folium.Polygon(
-            locations=row['coordinates'],
+            locations=row.coordinates,
             color='#e94560' if is_selected else color,
             weight=3 if is_selected else 1,
             fill=True,
@@ -440,27 +508,26 @@ def create_map(df, selected_parcel=None, show_labels=True, map_style="satellite"
             popup=folium.Popup(
                 f"""
                 <div style="font-family: Arial; min-width: 250px;">
-                    <h4 style="color: #e94560; margin-bottom: 10px;">{row['owner']}</h4>
+                    <h4 style="color: #e94560; margin-bottom: 10px;">{row.owner}</h4>
                     <hr style="border-color: #e94560;">
-                    <p><strong>Parcel ID:</strong> {row['parcel_id']}</p>
-                    <p><strong>SBL:</strong> {row['sbl']}</p>
-                    <p><strong>Class:</strong> {row['property_class_desc']}</p>
-                    <p><strong>Acreage:</strong> {row['acreage']:.2f} acres</p>
-                    <p><strong>Assessed Value:</strong> ${row['assessed_value']:,}</p>
-                    <p><strong>Annual Taxes:</strong> ${row['annual_taxes']:,.2f}</p>
+                    <p><strong>Parcel ID:</strong> {row.parcel_id}</p>
+                    <p><strong>SBL:</strong> {row.sbl}</p>
+                    <p><strong>Class:</strong> {row.property_class_desc}</p>
+                    <p><strong>Acreage:</strong> {row.acreage:.2f} acres</p>
+                    <p><strong>Assessed Value:</strong> ${row.assessed_value:,}</p>
+                    <p><strong>Annual Taxes:</strong> ${row.annual_taxes:,.2f}</p>
                     <hr>
                     <p><strong>Mailing Address:</strong><br>
-                    {row['mailing_address']}<br>
-                    {row['mailing_city']}, {row['mailing_state']} {row['mailing_zip']}</p>
+                    {row.mailing_address}<br>
+                    {row.mailing_city}, {row.mailing_state} {row.mailing_zip}</p>
                 </div>
                 """,
                 max_width=300
             ),
-            tooltip=f"{row['owner']} - {row['acreage']:.1f} ac"
+            tooltip=f"{row.owner} - {row.acreage:.1f} ac"
         )
         
         # Add to appropriate group
-        prop_class = row['property_class'][0]
         if prop_class == "2":
             polygon.add_to(residential_group)
         elif prop_class == "3":
@@ -473,9 +540,9 @@ def create_map(df, selected_parcel=None, show_labels=True, map_style="satellite"
         # Add label if enabled
         if show_labels:
             folium.Marker(
-                location=[row['latitude'], row['longitude']],
+                location=[row.latitude, row.longitude],
                 icon=folium.DivIcon(
-                    html=f'<div style="font-size: 8px; color: white; text-shadow: 1px 1px 2px black; white-space: nowrap;">{row["owner"][:15]}</div>',
+                    html=f'<div style="font-size: 8px; color: white; text-shadow: 1px 1px 2px black; white-space: nowrap;">{row.owner[:15]}</div>',
                     icon_size=(100, 20),
                     icon_anchor=(50, 10)
                 )
@@ -579,14 +646,15 @@ def main():
             placeholder="Start typing..."
         )
         
-        # Filter results based on search
+        # Filter results based on search (literal matches; owner and address
+        # are matched against their pre-lowered sidecar columns)
         if search_query:
             if search_type == "Owner Name":
-                filtered_df = df[df['owner'].str.lower().str.contains(search_query.lower())]
+                filtered_df = df[df['_owner_lc'].str.contains(search_query.lower(), regex=False, na=False)]
             elif search_type == "Parcel ID":
-                filtered_df = df[df['parcel_id'].str.contains(search_query)]
+                filtered_df = df[df['parcel_id'].str.contains(search_query, regex=False, na=False)]
             else:
-                filtered_df = df[df['mailing_address'].str.lower().str.contains(search_query.lower())]
+                filtered_df = df[df['_mailing_address_lc'].str.contains(search_query.lower(), regex=False, na=False)]
         else:
             filtered_df = df
         
@@ -679,25 +747,18 @@ def main():
         # Data settings
         st.markdown("### ⚙️ Data Settings")
         
-        # Check data source
+        # Check data source - load_parcel_data already parsed the file once
         data_file = Path(DEFAULT_DATA_FILE)
-        if data_file.exists():
-            try:
-                with open(data_file, "r") as f:
-                    cached_data = json.load(f)
-                is_real_data = len(cached_data) > 0
-                st.success(f"✅ **Real NYS Data**")
-                st.write(f"📊 {len(df):,} parcels loaded")
-                st.write(f"📍 {df['municipality'].nunique()} municipalities")
-                
-                if st.button("🔄 Clear & Use Sample"):
-                    data_file.unlink()
-                    st.cache_data.clear()
-                    st.rerun()
-            except:
-                is_real_data = False
-        else:
-            is_real_data = False
+        is_real_data = data_file.exists() and df.attrs.get('is_real_data', False)
+        if is_real_data:
+            st.success(f"✅ **Real NYS Data**")
+            st.write(f"📊 {len(df):,} parcels loaded")
+            st.write(f"📍 {df['municipality'].nunique()} municipalities")
+            
+            if st.button("🔄 Clear & Use Sample"):
+                data_file.unlink()
+                st.cache_data.clear()
+                st.rerun()
         
         if not is_real_data:
             st.warning("⚠️ **Sample Data Mode**")
@@ -764,6 +825,7 @@ def main():
         if filtered_df.empty:
             st.warning("⚠️ No parcels match your current filters. Try adjusting your search criteria.")
             # Show empty map centered on Lanesville
+            import folium
             m = folium.Map(
                 location=[42.1856, -74.2848],
                 zoom_start=14,
@@ -802,7 +864,11 @@ def main():
             if st.button("📄 Export Property Report"):
                 st.download_button(
                     label="Download JSON",
-                    data=json.dumps(selected_parcel.to_dict(), indent=2, default=str),
+                    data=json.dumps(
+                        selected_parcel[~selected_parcel.index.str.startswith('_')].to_dict(),
+                        indent=2,
+                        default=str
+                    ),
                     file_name=f"property_{selected_parcel['parcel_id'].replace('.', '_')}.json",
                     mime="application/json"
                 )
@@ -812,8 +878,15 @@ def main():
     # Search results table
     with st.expander("📊 Search Results Table", expanded=False):
         display_cols = ['parcel_id', 'owner', 'property_class_desc', 'acreage', 'assessed_value', 'mailing_address', 'mailing_city']
+        results_df = filtered_df
+        if len(filtered_df) > RESULTS_PREVIEW_ROWS:
+            show_all = st.checkbox(f"Show all {len(filtered_df):,} results", value=False)
+            if not show_all:
+                st.caption(f"Showing first {RESULTS_PREVIEW_ROWS} of {len(filtered_df):,} results")
+                results_df = filtered_df.head(RESULTS_PREVIEW_ROWS)
+        
         st.dataframe(
-            filtered_df[display_cols].rename(columns={
+            results_df[display_cols].rename(columns={
                 'parcel_id': 'Parcel ID',
                 'owner': 'Owner',
                 'property_class_desc': 'Property Type',
@@ -827,7 +900,7 @@ def main():
         )
         
         # Export all results
-        csv = filtered_df.to_csv(index=False)
+        csv = export_columns(filtered_df).to_csv(index=False)
         st.download_button(
             label="📥 Download All Results (CSV)",
             data=csv,
@@ -3,12 +3,17 @@ Data Loader for Lanesville Property Finder
 Utilities for loading real parcel data from official NYS/Greene County sources
 """
 
+import os
+import tempfile
 import requests
-import json
 import pandas as pd
 import geopandas as gpd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from constants import DEFAULT_DATA_FILE
+from utils.http import create_session
+from utils.jsonio import loads, load_columns
 from shapely.geometry import shape, mapping
 import logging
 
@@ -46,6 +51,7 @@ class GreeneCountyParcelLoader:
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.session = create_session(cache_name=str(self.data_dir / "http_cache"))
         
     def fetch_nys_parcels(self, bbox: dict = None) -> gpd.GeoDataFrame:
         """
@@ -71,10 +77,10 @@ class GreeneCountyParcelLoader:
         
         try:
             logger.info(f"Fetching parcels from NYS GIS...")
-            response = requests.get(url, params=params, timeout=60)
+            response = self.session.get(url, params=params, timeout=60)
             response.raise_for_status()
             
-            geojson = response.json()
+            geojson = loads(response.content)
             gdf = gpd.GeoDataFrame.from_features(geojson['features'])
             gdf.set_crs(epsg=4326, inplace=True)
             
@@ -126,16 +132,19 @@ class GreeneCountyParcelLoader:
         """
         records = []
         
-        for idx, row in gdf.iterrows():
+        # Plain dicts per row - iterrows would build a Series for every parcel
+        for idx, row in zip(gdf.index, gdf.to_dict(orient="records")):
+            geometry = row["geometry"]
+            
             # Extract centroid for marker placement
-            centroid = row.geometry.centroid
+            centroid = geometry.centroid
             
             # Get exterior coordinates for polygon display
-            if row.geometry.geom_type == 'Polygon':
-                coords = [list(c)[::-1] for c in row.geometry.exterior.coords]
-            elif row.geometry.geom_type == 'MultiPolygon':
+            if geometry.geom_type == 'Polygon':
+                coords = [list(c)[::-1] for c in geometry.exterior.coords]
+            elif geometry.geom_type == 'MultiPolygon':
                 # Use the largest polygon
-                largest = max(row.geometry.geoms, key=lambda x: x.area)
+                largest = max(geometry.geoms, key=lambda x: x.area)
                 coords = [list(c)[::-1] for c in largest.exterior.coords]
             else:
                 coords = [[centroid.y, centroid.x]]
@@ -176,13 +185,10 @@ class GreeneCountyParcelLoader:
         """Save processed parcel data to JSON for the app."""
         output_path = self.data_dir / filename
         
-        # Convert to JSON-serializable format
-        records = df.to_dict(orient='records')
-        
-        with open(output_path, 'w') as f:
-            json.dump(records, f, indent=2, default=str)
+        # Written from the column buffers without building a dict per row
+        df.to_json(output_path, orient='records', indent=2, default_handler=str)
         
-        logger.info(f"Saved {len(records)} parcels to {output_path}")
+        logger.info(f"Saved {len(df)} parcels to {output_path}")
         return output_path
     
     def filter_lanesville(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
@@ -201,6 +207,51 @@ class GreeneCountyParcelLoader:
         return filtered
 
 
+def ensure_parquet(path) -> Path:
+    """
+    Convert a parcel JSON file to a Parquet sidecar and return its path.
+    
+    The conversion only runs when the sidecar is missing or older than the
+    JSON source, so page loads read typed columns instead of parsing JSON.
+    
+    A zstd-compressed copy (data/zip_12450_parcels.json.zst) is used when
+    the plain JSON file is absent.
+    
+    Args:
+        path: Path to the parcel JSON file (e.g. data/zip_12450_parcels.json)
+        
+    Returns:
+        Path to the Parquet file next to the JSON source
+    """
+    json_path = Path(path)
+    parquet_path = json_path.with_suffix(".parquet")
+    
+    compressed_path = json_path.with_name(json_path.name + ".zst")
+    if not json_path.exists() and compressed_path.exists():
+        json_path = compressed_path
+    
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= json_path.stat().st_mtime:
+        return parquet_path
+    
+    columns = load_columns(json_path)
+    
+    table = pa.Table.from_pandas(pd.DataFrame(columns), preserve_index=False)
+    # Written beside the target and swapped in, so a reader (or an interrupted
+    # conversion) never sees a half-written sidecar; the unique name keeps
+    # concurrent page loads from writing over each other's temp file
+    fd, tmp_name = tempfile.mkstemp(dir=parquet_path.parent, prefix=parquet_path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_name, compression='zstd')
+        os.replace(tmp_name, parquet_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    
+    logger.info(f"Converted {table.num_rows} parcels to {parquet_path}")
+    return parquet_path
+
+
 def download_and_process():
     """
     Main function to download and process parcel data.
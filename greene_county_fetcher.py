@@ -6,13 +6,32 @@ API Endpoint: https://services6.arcgis.com/EbVsqZ18sv1kVJ3k/arcgis/rest/services
 Total Records: ~38,370 parcels
 """
 
+from __future__ import annotations
+
 import requests
-import pandas as pd
+import os
+import sys
+import time
 from constants import DEFAULT_DATA_FILE
 import json
 from pathlib import Path
-from typing import Optional, Callable
-import time
+from typing import TYPE_CHECKING, Optional, Callable, Iterable
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils.http import create_session
+from utils.jsonio import loads
+
+# pandas and numpy are imported inside the functions that need them, so
+# lightweight uses (record counts, `--list`) skip their import cost
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import ijson
+    JSON_STREAM_ERRORS = (ijson.JSONError, ijson.IncompleteJSONError)
+except ImportError:
+    ijson = None
+    JSON_STREAM_ERRORS = ()
 
 # Greene County Tax Parcels API
 GREENE_COUNTY_API = "https://services6.arcgis.com/EbVsqZ18sv1kVJ3k/arcgis/rest/services/Greene_County_Tax_Parcels/FeatureServer/0"
@@ -20,6 +39,12 @@ GREENE_COUNTY_API = "https://services6.arcgis.com/EbVsqZ18sv1kVJ3k/arcgis/rest/s
 # ArcGIS typically limits to 1000-2000 records per request
 BATCH_SIZE = 1000
 
+# Concurrent page requests during a full fetch
+MAX_WORKERS = 8
+
+# Shared keep-alive session (with retries) for every API call in this module
+_SESSION = create_session(pool_maxsize=16)
+
 # Property class descriptions
 PROPERTY_CLASS_DESC = {
     "100": "Agricultural",
@@ -114,7 +139,7 @@ def get_record_count(municipality: Optional[str] = None) -> int:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         return data.get("count", 0)
@@ -135,7 +160,7 @@ def get_available_municipalities() -> list:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -152,6 +177,72 @@ def get_available_municipalities() -> list:
         return []
 
 
+def get_out_fields() -> str:
+    """
+    Build the outFields list for parcel queries
+    
+    ArcGIS rejects unknown field names, so _ATTRIBUTE_FIELDS is intersected
+    with the layer's schema (one metadata request). Falls back to "*" if the
+    schema can't be read.
+    """
+    try:
+        response = _SESSION.get(GREENE_COUNTY_API, params={"f": "json"}, timeout=30)
+        response.raise_for_status()
+        layer_fields = {field["name"] for field in response.json().get("fields", [])}
+    except Exception as e:
+        print(f"Error getting layer fields: {e}")
+        return "*"
+    
+    return ",".join(name for name in _ATTRIBUTE_FIELDS if name in layer_fields) or "*"
+
+
+# ArcGIS error bodies are small; only this much of a page is kept to check one
+_ERROR_BODY_LIMIT = 64 * 1024
+
+
+class _HeadRecorder:
+    """File-like wrapper that keeps the first bytes read from a stream"""
+    
+    def __init__(self, stream, limit: int = _ERROR_BODY_LIMIT):
+        self.stream = stream
+        self.limit = limit
+        self.head = b""
+        self.size = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        if self.size < self.limit:
+            self.head += data[:self.limit - self.size]
+        self.size += len(data)
+        return data
+
+
+def iter_page_features(stream) -> Iterable[dict]:
+    """
+    Yield the features of an ArcGIS query response as ijson parses them
+    
+    Each feature is handed on as soon as it is complete, so the page's raw
+    dicts are never all held at once. A page with no features is checked
+    for an ArcGIS error body, which is returned with HTTP 200.
+    
+    Args:
+        stream: Binary file-like response body (e.g. response.raw)
+        
+    Raises:
+        ValueError: If the body is an ArcGIS error
+    """
+    body = _HeadRecorder(stream)
+    found = False
+    for feature in ijson.items(body, "features.item", use_float=True):
+        found = True
+        yield feature
+    
+    if not found and body.size <= body.limit:
+        data = loads(body.head)
+        if isinstance(data, dict) and "error" in data:
+            raise ValueError(f"API Error: {data['error'].get('message', 'Unknown error')}")
+
+
 def fetch_all_parcels(
     progress_callback: Optional[Callable] = None,
     max_records: Optional[int] = None,
@@ -195,75 +286,106 @@ def fetch_all_parcels(
         total_to_fetch = total_count
     
     url = f"{GREENE_COUNTY_API}/query"
-    all_features = []
-    offset = 0
     
-    while offset < total_to_fetch:
+    # Only the attributes process_features uses - fewer bytes to send and parse
+    out_fields = get_out_fields()
+    
+    def fetch_page(offset: int):
+        """Fetch one page; returns (feature count, DataFrame or None), or None on failure"""
         params = {
             "where": where_clause,
-            "outFields": "*",
+            "outFields": out_fields,
             "returnGeometry": "true",
             "f": "json",
             "resultOffset": offset,
             "resultRecordCount": min(BATCH_SIZE, total_to_fetch - offset)
         }
         
-        try:
-            if progress_callback:
-                pct = (offset / total_to_fetch) * 100
-                progress_callback(f"Fetching parcels {offset:,} - {min(offset + BATCH_SIZE, total_to_fetch):,} of {total_to_fetch:,} ({pct:.1f}%)")
-            
-            response = requests.get(url, params=params, timeout=60)
+        # The with block releases the streamed connection back to the pool
+        with _SESSION.get(url, params=params, timeout=60, stream=True) as response:
             response.raise_for_status()
             
-            data = response.json()
+            if ijson is not None:
+                # Features go from the socket straight into process_features
+                # instead of parsing the whole page into dicts first
+                response.raw.decode_content = True
+                page_size = 0
+                
+                def counted(features):
+                    nonlocal page_size
+                    for page_size, feature in enumerate(features, 1):
+                        yield feature
+                
+                df = process_features(counted(iter_page_features(response.raw)))
+                return page_size, df if page_size else None
             
-            # Check for errors
-            if "error" in data:
+            data = response.json()
+        
+        # Check for errors
+        if "error" in data:
+            raise ValueError(f"API Error: {data['error'].get('message', 'Unknown error')}")
+        
+        features = data.get("features", [])
+        
+        return len(features), process_features(features) if features else None
+    
+    # Request pages concurrently over the shared keep-alive session
+    offsets = list(range(0, total_to_fetch, BATCH_SIZE))
+    pages = {}
+    fetched = 0
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch_page, offset): offset for offset in offsets}
+        
+        for future in as_completed(futures):
+            offset = futures[future]
+            try:
+                pages[offset] = future.result()
+            except requests.RequestException as e:
+                pages[offset] = None
                 if progress_callback:
-                    progress_callback(f"API Error: {data['error'].get('message', 'Unknown error')}")
-                break
-            
-            features = data.get("features", [])
-            
-            if not features:
-                break
-            
-            all_features.extend(features)
-            
-            # Check if we got fewer than requested (end of data)
-            if len(features) < BATCH_SIZE:
-                break
-            
-            offset += BATCH_SIZE
-            
-            # Rate limiting - be nice to the server
-            time.sleep(0.3)
+                    progress_callback(f"Request error at offset {offset}: {e}")
+                continue
+            except (json.JSONDecodeError, *JSON_STREAM_ERRORS) as e:
+                pages[offset] = None
+                if progress_callback:
+                    progress_callback(f"JSON decode error: {e}")
+                continue
+            except ValueError as e:
+                pages[offset] = None
+                if progress_callback:
+                    progress_callback(str(e))
+                continue
             
-        except requests.exceptions.Timeout:
-            if progress_callback:
-                progress_callback(f"Timeout at offset {offset}, retrying...")
-            time.sleep(2)
-            continue
-        except requests.RequestException as e:
+            fetched += pages[offset][0]
             if progress_callback:
-                progress_callback(f"Request error at offset {offset}: {e}")
+                pct = (fetched / total_to_fetch) * 100
+                progress_callback(f"Fetched {fetched:,} of {total_to_fetch:,} parcels ({pct:.1f}%)")
+    
+    # Stitch pages in offset order, stopping at the first failed or short page
+    frames = []
+    for offset in offsets:
+        page = pages.get(offset)
+        if page is None or page[1] is None:
             break
-        except json.JSONDecodeError as e:
-            if progress_callback:
-                progress_callback(f"JSON decode error: {e}")
+        count, frame = page
+        frames.append(frame)
+        if count < BATCH_SIZE:
             break
     
-    if not all_features:
+    if not frames:
         if progress_callback:
             progress_callback("No features retrieved")
         return None
     
     if progress_callback:
-        progress_callback(f"Processing {len(all_features):,} parcels...")
+        progress_callback(f"Processing {sum(len(f) for f in frames):,} parcels...")
     
     # Convert to DataFrame
-    df = process_features(all_features)
+    import pandas as pd
+    
+    # Pages carry different category sets, which concat widens to object
+    df = pd.concat(frames, ignore_index=True).astype(_RECORD_DTYPES)
     
     if progress_callback:
         progress_callback(f"Successfully processed {len(df):,} parcels")
@@ -271,16 +393,77 @@ def fetch_all_parcels(
     return df
 
 
-def process_features(features: list) -> pd.DataFrame:
-    """Process ArcGIS features into DataFrame"""
+# Attribute names process_features reads (it tries several spellings because
+# field names vary between NYS parcel layers); page queries request only these
+_ATTRIBUTE_FIELDS = (
+    "PRINT_KEY", "PrintKey", "PARCEL_ID", "ParcelID", "SBL", "OBJECTID", "SWIS_SBL",
+    "OWNER", "Owner", "OWNER1", "OWNER_NAME", "NAME", "OwnerName",
+    "MAIL_ADDR", "MailAddr", "MAILING_ADDRESS", "Mail_Addr",
+    "MAIL_CITY", "MailCity", "MAILING_CITY", "PO",
+    "MAIL_STATE", "MailState", "MAILING_STATE",
+    "MAIL_ZIP", "MailZip", "MAILING_ZIP", "ZIP",
+    "PROP_ADDR", "PropAddr", "PROPERTY_ADDRESS", "LOC_ADDR", "LOCATION",
+    "PROP_CLASS", "PropClass", "PROPERTY_CLASS", "LUC", "CLASS",
+    "ACRES", "Acres", "CALC_ACRES", "ACREAGE", "GIS_ACRES",
+    "TOTAL_AV", "TotalAV", "ASSESSED_VALUE", "FULL_VAL", "TOTAL_VALUE",
+    "LAND_AV", "LandAV", "LAND_VALUE",
+    "MUNI_NAME", "MuniName", "MUNICIPALITY", "TOWN", "CITY",
+    "SCHOOL_NAME", "SchoolName", "SCHOOL", "SCHOOL_DIST",
+    "SWIS", "SwisCode", "SWIS_CODE",
+    "DEED_BOOK", "DeedBook", "DEED_PAGE", "DeedPage",
+    "SALE_DATE", "SaleDate", "SALE_PRICE", "SalePrice",
+)
+
+# Columns built per feature by process_features (geometry columns are added
+# afterwards), and the compact dtypes the finished frame is cast to
+_RECORD_COLUMNS = [
+    "parcel_id", "sbl", "owner", "mailing_address", "mailing_city",
+    "mailing_state", "mailing_zip", "property_address", "property_class",
+    "acreage", "assessed_value", "land_value", "municipality",
+    "school_district", "swis_code", "county", "improvement_value",
+    "annual_taxes", "tax_year", "deed_book", "deed_page", "last_sale_date",
+    "last_sale_price",
+]
+_RECORD_DTYPES = {
+    "acreage": "float32",
+    # Dollar values stay 64-bit: large parcels can exceed int32's ~$2.1B
+    "assessed_value": "int64",
+    "land_value": "int64",
+    "improvement_value": "int64",
+    "latitude": "float32",
+    "longitude": "float32",
+    "property_class": "category",
+}
+
+
+def describe_property_classes(prop_classes: pd.Series) -> pd.Series:
+    """
+    Map property class codes to descriptions
+    
+    Tries the exact code, then the first two digits + "0", then the first
+    digit + "00" (e.g. "215" -> "210" -> "200"), falling back to "Unknown".
+    """
+    desc = prop_classes.map(PROPERTY_CLASS_DESC)
+    desc = desc.fillna((prop_classes.str[:2] + "0").map(PROPERTY_CLASS_DESC))
+    desc = desc.fillna((prop_classes.str[:1] + "00").map(PROPERTY_CLASS_DESC))
+    return desc.fillna("Unknown")
+
+
+def process_features(features: Iterable[dict]) -> pd.DataFrame:
+    """Process ArcGIS features (any iterable, e.g. an ijson stream) into DataFrame"""
+    import numpy as np
+    import pandas as pd
+    
     records = []
+    outer_rings = []
     
     for feature in features:
         attrs = feature.get("attributes", {})
         geometry = feature.get("geometry", {})
         
         # Map fields - adjust based on actual field names in the API
-        # Common field names in NYS parcel data
+        # Common field names in NYS parcel data. Low-cardinality strings are
+        # interned so repeated values share one object across records.
         record = {
             "parcel_id": (
                 attrs.get("PRINT_KEY") or 
@@ -312,19 +495,19 @@ def process_features(features: list) -> pd.DataFrame:
                 attrs.get("Mail_Addr") or
                 ""
             ),
-            "mailing_city": (
+            "mailing_city": sys.intern(str(
                 attrs.get("MAIL_CITY") or 
                 attrs.get("MailCity") or
                 attrs.get("MAILING_CITY") or
                 attrs.get("PO") or
                 ""
-            ),
-            "mailing_state": (
+            )),
+            "mailing_state": sys.intern(str(
                 attrs.get("MAIL_STATE") or 
                 attrs.get("MailState") or
                 attrs.get("MAILING_STATE") or
                 "NY"
-            ),
+            )),
             "mailing_zip": str(
                 attrs.get("MAIL_ZIP") or 
                 attrs.get("MailZip") or
@@ -340,14 +523,14 @@ def process_features(features: list) -> pd.DataFrame:
                 attrs.get("LOCATION") or
                 ""
             ),
-            "property_class": str(
+            "property_class": sys.intern(str(
                 attrs.get("PROP_CLASS") or 
                 attrs.get("PropClass") or
                 attrs.get("PROPERTY_CLASS") or
                 attrs.get("LUC") or
                 attrs.get("CLASS") or
                 ""
-            ),
+            )),
             "acreage": float(
                 attrs.get("ACRES") or 
                 attrs.get("Acres") or
@@ -370,21 +553,21 @@ def process_features(features: list) -> pd.DataFrame:
                 attrs.get("LAND_VALUE") or
                 0
             ),
-            "municipality": (
+            "municipality": sys.intern(str(
                 attrs.get("MUNI_NAME") or 
                 attrs.get("MuniName") or
                 attrs.get("MUNICIPALITY") or
                 attrs.get("TOWN") or
                 attrs.get("CITY") or
                 ""
-            ),
-            "school_district": (
+            )),
+            "school_district": sys.intern(str(
                 attrs.get("SCHOOL_NAME") or 
                 attrs.get("SchoolName") or
                 attrs.get("SCHOOL") or
                 attrs.get("SCHOOL_DIST") or
                 ""
-            ),
+            )),
             "swis_code": (
                 attrs.get("SWIS") or
                 attrs.get("SwisCode") or
@@ -393,38 +576,14 @@ def process_features(features: list) -> pd.DataFrame:
             ),
         }
         
-        # Get property class description
-        prop_class = record["property_class"]
-        if prop_class:
-            record["property_class_desc"] = PROPERTY_CLASS_DESC.get(
-                prop_class,
-                PROPERTY_CLASS_DESC.get(prop_class[:2] + "0" if len(prop_class) >= 2 else prop_class, 
-                PROPERTY_CLASS_DESC.get(prop_class[0] + "00" if len(prop_class) >= 1 else "", "Unknown"))
-            )
-        else:
-            record["property_class_desc"] = "Unknown"
-        
-        # Process geometry (rings format from ArcGIS)
+        # Process geometry (rings format from ArcGIS); centroids are computed
+        # for all features at once after the loop
+        ring = []
         if geometry and "rings" in geometry:
             rings = geometry.get("rings", [[]])
             if rings and rings[0]:
-                coords = rings[0]
-                # Convert to [lat, lon] format for Folium (ArcGIS uses [x, y] = [lon, lat])
-                record["coordinates"] = [[c[1], c[0]] for c in coords[:100]]  # Limit points
-                
-                # Calculate centroid
-                lons = [c[0] for c in coords]
-                lats = [c[1] for c in coords]
-                record["longitude"] = sum(lons) / len(lons)
-                record["latitude"] = sum(lats) / len(lats)
-            else:
-                record["coordinates"] = []
-                record["latitude"] = None
-                record["longitude"] = None
-        else:
-            record["coordinates"] = []
-            record["latitude"] = None
-            record["longitude"] = None
+                ring = rings[0]
+        outer_rings.append(ring)
         
         # Derived fields
         record["county"] = "Greene"
@@ -438,40 +597,143 @@ def process_features(features: list) -> pd.DataFrame:
         
         records.append(record)
     
-    df = pd.DataFrame(records)
+    df = pd.DataFrame.from_records(records, columns=_RECORD_COLUMNS)
+    
+    # All outer-ring vertices as one (n, 2) array of [x, y] = [lon, lat]
+    lens = np.fromiter(map(len, outer_rings), dtype=np.intp, count=len(outer_rings))
+    vertices = list(chain.from_iterable(outer_rings))
+    flat = np.array(vertices, dtype=np.float64)[:, :2] if vertices else np.empty((0, 2))
+    
+    # Vertex-mean centroids in one reduction over all rings; features
+    # without geometry get NaN and are dropped below
+    centroids = np.full((len(outer_rings), 2), np.nan)
+    has_ring = lens > 0
+    if has_ring.any():
+        counts = lens[has_ring]
+        offsets = np.concatenate(([0], counts.cumsum()[:-1]))
+        centroids[has_ring] = np.add.reduceat(flat, offsets, axis=0) / counts[:, None]
+    
+    # Polygon outlines as float32 [lat, lon] arrays for Folium
+    latlon = flat[:, ::-1].astype(np.float32)
+    coordinates = pd.Series(
+        [ring[:100] for ring in np.split(latlon, lens.cumsum())[:-1]],  # Limit points
+        index=df.index,
+        dtype=object
+    )
+    
+    loc = df.columns.get_loc("swis_code") + 1
+    df.insert(loc, "coordinates", coordinates)
+    df.insert(loc + 1, "longitude", centroids[:, 0])
+    df.insert(loc + 2, "latitude", centroids[:, 1])
+    
+    # Property class descriptions in one pass over the column
+    df.insert(
+        df.columns.get_loc("swis_code") + 1,
+        "property_class_desc",
+        describe_property_classes(df["property_class"])
+    )
     
     # Clean up
     df = df.dropna(subset=["latitude", "longitude"])
     
-    return df
+    return df.astype(_RECORD_DTYPES)
 
 
-def save_to_file(df: pd.DataFrame, filename: str = "greene_county_parcels.json") -> Path:
-    """Save DataFrame to JSON file"""
+def save_to_file(df: pd.DataFrame, filename: str = "greene_county_parcels.parquet") -> Path:
+    """Save DataFrame to a Parquet or JSON file (chosen by the file suffix)"""
+    import numpy as np
+    import pandas as pd
+    
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
     
     output_path = data_dir / filename
+    # Written beside the target and swapped in, so an interrupted save never
+    # leaves a truncated cache behind
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
     
-    records = df.to_dict(orient="records")
-    
-    with open(output_path, "w") as f:
-        json.dump(records, f, indent=2, default=str)
+    try:
+        if output_path.suffix == ".parquet":
+            # Arrow needs one type per column; mixed attribute values are stored as text
+            df = df.copy()
+            if "coordinates" in df.columns:
+                # Flattened [lat, lon, lat, lon, ...] so Arrow stores list<float32>
+                df["coordinates"] = [np.asarray(c, dtype=np.float32).ravel() for c in df["coordinates"]]
+            for col in df.columns.drop("coordinates", errors="ignore"):
+                if pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed"):
+                    df[col] = df[col].map(lambda v: v if v is None else str(v))
+            df.to_parquet(tmp_path, compression="zstd", index=False)
+        else:
+            # Write float32 values by their shortest repr (10.37, not 10.369999885559082)
+            df = df.copy()
+            if "coordinates" in df.columns:
+                df["coordinates"] = [
+                    np.asarray(c).astype(str).astype(np.float64).tolist() for c in df["coordinates"]
+                ]
+            for col in df.select_dtypes("float32").columns:
+                df[col] = df[col].astype(str).astype(np.float64)
+            # Serialized straight from the column buffers, no per-row dicts
+            df.to_json(tmp_path, orient="records", indent=2, default_handler=str)
+        
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     
-    print(f"Saved {len(records):,} parcels to {output_path}")
+    print(f"Saved {len(df):,} parcels to {output_path}")
     return output_path
 
 
-def load_from_file(filename: str = "greene_county_parcels.json") -> Optional[pd.DataFrame]:
-    """Load DataFrame from JSON file"""
-    data_dir = Path("data")
-    file_path = data_dir / filename
+def resolve_data_file(filename: str) -> Path:
+    """Path of a file in the data directory, falling back to a JSON copy of a missing .parquet"""
+    file_path = Path("data") / filename
+    
+    # Older caches were written as JSON under the same name
+    if file_path.suffix == ".parquet" and not file_path.exists():
+        file_path = file_path.with_suffix(".json")
+    return file_path
+
+
+def cache_is_fresh(path: Path, max_age: Optional[float] = None) -> bool:
+    """
+    Check a cache file with a single stat call, without reading it
     
-    if file_path.exists():
+    Args:
+        path: Cache file path
+        max_age: Maximum age in seconds (None = any age)
+        
+    Returns:
+        True if the file exists and is younger than max_age
+    """
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return False
+    return max_age is None or time.time() - mtime < max_age
+
+
+def load_from_file(filename: str = "greene_county_parcels.parquet") -> Optional[pd.DataFrame]:
+    """Load DataFrame from a Parquet or JSON file, falling back to a JSON copy"""
+    import numpy as np
+    import pandas as pd
+    
+    file_path = resolve_data_file(filename)
+    
+    if not file_path.exists():
+        return None
+    
+    if file_path.suffix == ".parquet":
+        df = pd.read_parquet(file_path)
+    else:
         with open(file_path, "r") as f:
             records = json.load(f)
-        return pd.DataFrame(records)
-    return None
+        df = pd.DataFrame(records)
+    
+    if "coordinates" in df.columns:
+        df["coordinates"] = [
+            np.asarray(c, dtype=np.float32).reshape(-1, 2) for c in df["coordinates"]
+        ]
+    return df
 
 
 # Convenience function for the app
@@ -479,7 +741,8 @@ def fetch_greene_county_data(
     use_cache: bool = True,
     max_records: Optional[int] = None,
     municipality: Optional[str] = None,
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    max_age: Optional[float] = None
 ) -> Optional[pd.DataFrame]:
     """
     Main function to get Greene County parcel data
@@ -489,18 +752,20 @@ def fetch_greene_county_data(
         max_records: Limit number of records (None = all ~38,370)
         municipality: Filter by municipality (e.g., "Hunter" for Lanesville)
         progress_callback: Function for progress updates
+        max_age: Refetch when the cache is older than this many seconds
+            (None = use a cache of any age)
         
     Returns:
         DataFrame with parcel data
     """
     # Determine cache file name
     if municipality:
-        cache_file = f"{municipality.lower().replace(' ', '_')}_parcels.json"
+        cache_file = f"{municipality.lower().replace(' ', '_')}_parcels.parquet"
     else:
-        cache_file = "greene_county_parcels.json"
+        cache_file = "greene_county_parcels.parquet"
     
-    # Check cache first
-    if use_cache:
+    # Check cache first; missing or stale files are skipped without being parsed
+    if use_cache and cache_is_fresh(resolve_data_file(cache_file), max_age):
         df = load_from_file(cache_file)
         if df is not None and len(df) > 0:
             if progress_callback:
@@ -518,7 +783,7 @@ def fetch_greene_county_data(
         # Save to cache
         save_to_file(df, cache_file)
         
-        # Also save as the default file the app looks for
+        # Also save as the default (JSON) file the app looks for
         save_to_file(df, DEFAULT_DATA_FILE.split("/")[-1])
         
         return df
@@ -596,9 +861,9 @@ if __name__ == "__main__":
                 print(f"  - {muni}: {count:,} parcels")
         print()
         if municipality:
-            print(f"Data saved to: data/{municipality.lower()}_parcels.json")
+            print(f"Data saved to: data/{municipality.lower().replace(' ', '_')}_parcels.parquet")
         else:
-            print("Data saved to: data/greene_county_parcels.json")
+            print("Data saved to: data/greene_county_parcels.parquet")
         print(f"              {DEFAULT_DATA_FILE}")
         print()
         print("Usage examples:")
@@ -5,11 +5,14 @@ Fetches real tax parcel data from NYS GIS REST services
 
 import requests
 import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
 from constants import DEFAULT_DATA_FILE
+from utils.http import create_session
+from utils.jsonio import loads, load_file
 from typing import Optional, Dict, List
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # NYS GIS Tax Parcel Service URLs
 NYS_TAX_PARCEL_SERVICE = "https://services6.arcgis.com/DZHaqZm9cxOD4CWM/arcgis/rest/services"
@@ -21,6 +24,12 @@ PARCEL_ENDPOINTS = [
     "/NYS_Tax_Parcels/FeatureServer/0",
 ]
 
+# Page size used when the service doesn't report maxRecordCount
+DEFAULT_MAX_RECORD_COUNT = 1000
+
+# Concurrent page requests against the service
+MAX_WORKERS = 4
+
 # Greene County bounding box (covers all of Greene County)
 GREENE_COUNTY_BBOX = {
     "xmin": -74.55,
@@ -64,6 +73,26 @@ FIELD_MAPPING = {
     "LAND_VALUE": "land_value",
 }
 
+# Defaults for mapped fields missing from a feature
+FIELD_DEFAULTS = {
+    "owner": "Unknown",
+    "sbl": "",
+    "mailing_address": "",
+    "mailing_city": "",
+    "mailing_state": "NY",
+    "mailing_zip": "",
+    "property_class": "",
+    "municipality": "",
+    "county": "Greene",
+    "school_district": "",
+}
+
+# Mapped fields extracted as float64 arrays (missing values become 0)
+NUMERIC_FIELDS = ["acreage", "assessed_value", "land_value"]
+
+# Mapped fields with no default, omitted when no feature has them
+OPTIONAL_FIELDS = ["property_address", "full_market_value", "swis_code"]
+
 # Property class descriptions
 PROPERTY_CLASS_DESC = {
     "100": "Agricultural",
@@ -136,6 +165,44 @@ PROPERTY_CLASS_DESC = {
     "990": "Town Land",
 }
 
+# Sorted int16 class codes and category codes into their unique labels
+_CLASS_CODES = np.array(sorted(int(code) for code in PROPERTY_CLASS_DESC), dtype=np.int16)
+_CLASS_LABEL_CODES, _CLASS_LABELS = pd.factorize(
+    np.array([PROPERTY_CLASS_DESC[str(code)] for code in _CLASS_CODES] + ["Unknown"], dtype=object)
+)
+
+
+def describe_property_classes(prop_classes: List) -> pd.Categorical:
+    """
+    Translate property class codes to descriptions in one vectorized pass
+    
+    Matches the exact 3-digit code first, then falls back to the first two
+    digits + "0" (e.g. "215" -> "210"), then "Unknown".
+    
+    Args:
+        prop_classes: Property class codes (any type; compared as strings)
+        
+    Returns:
+        Categorical of descriptions with categories from PROPERTY_CLASS_DESC
+    """
+    classes = pd.Series(prop_classes, dtype=object).astype(str)
+    exact = pd.to_numeric(classes.where(classes.str.fullmatch(r"\d{3}")), errors="coerce")
+    prefix = pd.to_numeric(classes.str[:2].where(classes.str.match(r"\d{2}")), errors="coerce") * 10
+    
+    unknown = len(_CLASS_CODES)
+    idx = np.full(len(classes), unknown, dtype=np.intp)
+    
+    # Apply the fallback first so exact matches overwrite it
+    for keys in (prefix.to_numpy(), exact.to_numpy()):
+        valid = ~np.isnan(keys)
+        pos = np.searchsorted(_CLASS_CODES, keys[valid])
+        pos_clipped = np.minimum(pos, unknown - 1)
+        found = _CLASS_CODES[pos_clipped] == keys[valid]
+        valid_idx = np.flatnonzero(valid)
+        idx[valid_idx[found]] = pos_clipped[found]
+    
+    return pd.Categorical.from_codes(_CLASS_LABEL_CODES[idx], categories=_CLASS_LABELS)
+
 
 class NYSParcelFetcher:
     """Fetch parcel data from NYS GIS services"""
@@ -144,17 +211,20 @@ class NYSParcelFetcher:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.base_url = NYS_TAX_PARCEL_SERVICE
+        self.session = create_session(cache_name=str(self.cache_dir / "http_cache"))
+        self.max_record_count = DEFAULT_MAX_RECORD_COUNT
         
     def _find_working_endpoint(self) -> Optional[str]:
         """Find a working parcel service endpoint"""
         for endpoint in PARCEL_ENDPOINTS:
             url = f"{self.base_url}{endpoint}"
             try:
-                response = requests.get(f"{url}?f=json", timeout=10)
+                response = self.session.get(f"{url}?f=json", timeout=10)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = loads(response.content)
                     if "name" in data or "fields" in data:
                         print(f"Found working endpoint: {endpoint}")
+                        self.max_record_count = data.get("maxRecordCount") or DEFAULT_MAX_RECORD_COUNT
                         return url
             except:
                 continue
@@ -165,16 +235,22 @@ class NYSParcelFetcher:
         bbox: Dict = None,
         county: str = "Greene",
         max_records: int = 5000,
-        progress_callback=None
+        progress_callback=None,
+        return_geometry: bool = True
     ) -> Optional[pd.DataFrame]:
         """
         Fetch parcels from NYS GIS service
         
+        Pages are requested concurrently using resultOffset/resultRecordCount
+        and stitched back together in offset order.
+        
         Args:
             bbox: Bounding box dict with xmin, ymin, xmax, ymax
             county: County name to filter (default Greene)
             max_records: Maximum records to fetch
             progress_callback: Optional callback for progress updates
+            return_geometry: Whether to request parcel geometry (the bulk
+                of the payload; not needed for attribute-only views)
             
         Returns:
             DataFrame with parcel data or None if fetch fails
@@ -189,66 +265,66 @@ class NYSParcelFetcher:
         
         url = f"{base_url}/query"
         
-        all_features = []
-        offset = 0
-        batch_size = 1000  # NYS typically limits to 1000 per request
+        base_params = {
+            "where": f"COUNTY_NAME='{county}'" if county else "1=1",
+            "geometry": json.dumps({
+                "xmin": bbox["xmin"],
+                "ymin": bbox["ymin"],
+                "xmax": bbox["xmax"],
+                "ymax": bbox["ymax"],
+                "spatialReference": {"wkid": 4326}
+            }),
+            "geometryType": "esriGeometryEnvelope",
+            "spatialRel": "esriSpatialRelIntersects",
+            "outFields": "*",
+            "returnGeometry": "true" if return_geometry else "false",
+            "f": "geojson"
+        }
         
-        while offset < max_records:
-            params = {
-                "where": f"COUNTY_NAME='{county}'" if county else "1=1",
-                "geometry": json.dumps({
-                    "xmin": bbox["xmin"],
-                    "ymin": bbox["ymin"],
-                    "xmax": bbox["xmax"],
-                    "ymax": bbox["ymax"],
-                    "spatialReference": {"wkid": 4326}
-                }),
-                "geometryType": "esriGeometryEnvelope",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "*",
-                "returnGeometry": "true",
-                "f": "geojson",
-                "resultOffset": offset,
-                "resultRecordCount": min(batch_size, max_records - offset)
-            }
-            
+        # Page size is capped by the service's maxRecordCount
+        batch_size = self.max_record_count
+        offsets = list(range(0, max_records, batch_size))
+        
+        if progress_callback:
+            progress_callback(f"Fetching up to {max_records} records in {len(offsets)} pages...")
+        
+        def fetch_page(offset: int) -> Optional[List[Dict]]:
+            params = dict(
+                base_params,
+                resultOffset=offset,
+                resultRecordCount=min(batch_size, max_records - offset)
+            )
             try:
-                if progress_callback:
-                    progress_callback(f"Fetching records {offset} to {offset + batch_size}...")
-                    
-                response = requests.get(url, params=params, timeout=60)
+                response = self.session.get(url, params=params, timeout=60)
                 response.raise_for_status()
-                
-                data = response.json()
-                
-                if "features" not in data:
-                    print(f"No features in response: {data.get('error', 'Unknown error')}")
-                    break
-                    
-                features = data["features"]
-                
-                if not features:
-                    break
-                    
-                all_features.extend(features)
-                
-                if progress_callback:
-                    progress_callback(f"Retrieved {len(all_features)} parcels so far...")
-                
-                # Check if we got fewer than requested (end of data)
-                if len(features) < batch_size:
-                    break
-                    
-                offset += batch_size
-                time.sleep(0.5)  # Rate limiting
-                
+                data = loads(response.content)
             except requests.RequestException as e:
                 print(f"Request error at offset {offset}: {e}")
-                break
+                return None
             except json.JSONDecodeError as e:
                 print(f"JSON decode error: {e}")
+                return None
+            
+            if "features" not in data:
+                print(f"No features in response: {data.get('error', 'Unknown error')}")
+                return None
+            return data["features"]
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            pages = list(executor.map(fetch_page, offsets))
+        
+        # Stitch pages in order, stopping at the first failed or short page
+        all_features = []
+        for features in pages:
+            if not features:
+                break
+            all_features.extend(features)
+            if len(features) < batch_size:
                 break
         
+        if progress_callback:
+            progress_callback(f"Retrieved {len(all_features)} parcels")
+        
         if not all_features:
             return None
             
@@ -261,96 +337,100 @@ class NYSParcelFetcher:
         return df
     
     def _process_features(self, features: List[Dict]) -> pd.DataFrame:
-        """Process GeoJSON features into DataFrame"""
-        records = []
+        """
+        Process GeoJSON features into DataFrame
+        
+        Columns are extracted in a single pass into one list per output
+        column (numeric values into preallocated float64 arrays) and handed
+        to pandas as a dict of columns, avoiding a dict per row.
+        """
+        n = len(features)
+        
+        # Later source fields in FIELD_MAPPING take precedence, as before
+        sources_by_target = {}
+        for source_field, target_field in FIELD_MAPPING.items():
+            sources_by_target.setdefault(target_field, []).insert(0, source_field)
+        
+        text_targets = [t for t in sources_by_target if t not in NUMERIC_FIELDS]
+        cols = {target: [] for target in text_targets}
+        numeric = {target: np.zeros(n, dtype=np.float64) for target in NUMERIC_FIELDS}
+        coordinates, lats, lons = [], [], []
         
-        for feature in features:
+        for i, feature in enumerate(features):
             props = feature.get("properties", {})
             geometry = feature.get("geometry", {})
             
-            # Map fields
-            record = {}
-            for source_field, target_field in FIELD_MAPPING.items():
-                if source_field in props:
-                    record[target_field] = props[source_field]
+            for target in text_targets:
+                value = None
+                for source_field in sources_by_target[target]:
+                    if source_field in props:
+                        value = props[source_field]
+                        break
+                if value is None:
+                    value = props.get("OBJECTID", "N/A") if target == "parcel_id" else FIELD_DEFAULTS.get(target)
+                cols[target].append(value)
             
-            # Get property class description
-            prop_class = str(record.get("property_class", ""))
-            record["property_class_desc"] = PROPERTY_CLASS_DESC.get(
-                prop_class, 
-                PROPERTY_CLASS_DESC.get(prop_class[:2] + "0", "Unknown")
-            )
+            for target in NUMERIC_FIELDS:
+                for source_field in sources_by_target[target]:
+                    value = props.get(source_field)
+                    # Blank attributes fall through to the next source (or 0)
+                    if value not in (None, ''):
+                        numeric[target][i] = value
+                        break
             
-            # Process geometry
+            # Process geometry; use first polygon of a multipolygon
+            coords = []
             if geometry and geometry.get("type") == "Polygon":
                 coords = geometry.get("coordinates", [[]])[0]
-                # Convert to [lat, lon] format for Folium
-                record["coordinates"] = [[c[1], c[0]] for c in coords[:50]]  # Limit points
-                
-                # Calculate centroid
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    record["longitude"] = sum(lons) / len(lons)
-                    record["latitude"] = sum(lats) / len(lats)
             elif geometry and geometry.get("type") == "MultiPolygon":
-                # Use first polygon of multipolygon
                 coords = geometry.get("coordinates", [[[]]])[0][0]
-                record["coordinates"] = [[c[1], c[0]] for c in coords[:50]]
-                
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    record["longitude"] = sum(lons) / len(lons)
-                    record["latitude"] = sum(lats) / len(lats)
-            else:
-                record["coordinates"] = []
-                record["latitude"] = None
-                record["longitude"] = None
             
-            # Fill in missing fields with defaults
-            record.setdefault("owner", "Unknown")
-            record.setdefault("parcel_id", props.get("OBJECTID", "N/A"))
-            record.setdefault("sbl", "")
-            record.setdefault("mailing_address", "")
-            record.setdefault("mailing_city", "")
-            record.setdefault("mailing_state", "NY")
-            record.setdefault("mailing_zip", "")
-            record.setdefault("property_class", "")
-            record.setdefault("acreage", 0)
-            record.setdefault("assessed_value", 0)
-            record.setdefault("land_value", 0)
-            record.setdefault("municipality", "")
-            record.setdefault("county", "Greene")
-            record.setdefault("school_district", "")
+            # Convert to [lat, lon] format for Folium
+            coordinates.append([[c[1], c[0]] for c in coords[:50]])  # Limit points
             
-            # Calculate derived fields
-            if record["assessed_value"] and record["land_value"]:
-                record["improvement_value"] = int(record["assessed_value"]) - int(record["land_value"])
+            # Calculate centroid
+            if coords:
+                lons.append(sum(c[0] for c in coords) / len(coords))
+                lats.append(sum(c[1] for c in coords) / len(coords))
             else:
-                record["improvement_value"] = 0
-                
-            record["annual_taxes"] = round(float(record.get("assessed_value", 0) or 0) * 0.025, 2)
-            record["tax_year"] = 2024
-            record["deed_book"] = ""
-            record["deed_page"] = ""
-            record["last_sale_date"] = ""
-            record["last_sale_price"] = None
-            
-            records.append(record)
+                lons.append(None)
+                lats.append(None)
+        
+        # Drop optional fields the service never returned
+        for target in OPTIONAL_FIELDS:
+            if all(value is None for value in cols[target]):
+                del cols[target]
+        
+        assessed = numeric["assessed_value"].astype(np.int64)
+        land = numeric["land_value"].astype(np.int64)
         
-        return pd.DataFrame(records)
+        cols.update({
+            "property_class_desc": describe_property_classes(cols["property_class"]),
+            "coordinates": coordinates,
+            "latitude": np.array(lats, dtype=np.float64),
+            "longitude": np.array(lons, dtype=np.float64),
+            "acreage": numeric["acreage"],
+            "assessed_value": assessed,
+            "land_value": land,
+            # Calculate derived fields
+            "improvement_value": np.where((assessed != 0) & (land != 0), assessed - land, 0),
+            "annual_taxes": np.round(assessed * 0.025, 2),
+            "tax_year": np.full(n, 2024),
+            "deed_book": [""] * n,
+            "deed_page": [""] * n,
+            "last_sale_date": [""] * n,
+            "last_sale_price": [None] * n,
+        })
+        
+        return pd.DataFrame(cols, copy=False)
     
     def save_to_cache(self, df: pd.DataFrame, filename: str = DEFAULT_DATA_FILE.split("/")[-1]):
         """Save DataFrame to cache file"""
         output_path = self.cache_dir / filename
         
-        records = df.to_dict(orient="records")
-        
-        with open(output_path, "w") as f:
-            json.dump(records, f, indent=2, default=str)
+        df.to_json(output_path, orient="records", indent=2, default_handler=str)
             
-        print(f"Saved {len(records)} parcels to {output_path}")
+        print(f"Saved {len(df)} parcels to {output_path}")
         return output_path
     
     def load_from_cache(self, filename: str = DEFAULT_DATA_FILE.split("/")[-1]) -> Optional[pd.DataFrame]:
@@ -358,8 +438,7 @@ class NYSParcelFetcher:
         cache_path = self.cache_dir / filename
         
         if cache_path.exists():
-            with open(cache_path, "r") as f:
-                records = json.load(f)
+            records = load_file(cache_path)
             return pd.DataFrame(records)
         return None
 
@@ -45,6 +45,14 @@ def load_data():
     return load_parcel_data()
 
 
+def load_owner_portfolio():
+    """Per-owner totals, cached by the main app per dataset load"""
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from app import get_owner_portfolio
+    return get_owner_portfolio()
+
+
 def main():
     st.title("📊 Lanesville Property Analytics")
     st.markdown("*Comprehensive analysis of property ownership and values*")
@@ -89,7 +97,7 @@ def main():
     
     with col2:
         st.subheader("Assessed Value by Property Type")
-        value_by_type = df.groupby('property_class_desc')['assessed_value'].sum().sort_values(ascending=True).tail(10)
+        value_by_type = df.groupby('property_class_desc', observed=True)['assessed_value'].sum().sort_values(ascending=True).tail(10)
         
         fig = px.bar(
             x=value_by_type.values,
@@ -152,27 +160,24 @@ def main():
     
     # Top owners analysis
     st.subheader("🏆 Top Property Owners")
+    portfolio = load_owner_portfolio()
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("##### By Total Acreage")
-        top_by_acres = df.groupby('owner').agg({
-            'acreage': 'sum',
-            'parcel_id': 'count',
-            'assessed_value': 'sum'
-        }).sort_values('acreage', ascending=False).head(10)
+        top_by_acres = portfolio[['acreage', 'parcel_count', 'assessed_value']].sort_values(
+            'acreage', ascending=False
+        ).head(10)
         top_by_acres.columns = ['Total Acres', 'Parcels', 'Total Value']
         top_by_acres['Total Value'] = top_by_acres['Total Value'].apply(lambda x: f"${x:,.0f}")
         st.dataframe(top_by_acres, width="stretch")
     
     with col2:
         st.markdown("##### By Assessed Value")
-        top_by_value = df.groupby('owner').agg({
-            'assessed_value': 'sum',
-            'parcel_id': 'count',
-            'acreage': 'sum'
-        }).sort_values('assessed_value', ascending=False).head(10)
+        top_by_value = portfolio[['assessed_value', 'parcel_count', 'acreage']].sort_values(
+            'assessed_value', ascending=False
+        ).head(10)
         top_by_value.columns = ['Total Value', 'Parcels', 'Total Acres']
         top_by_value['Total Value'] = top_by_value['Total Value'].apply(lambda x: f"${x:,.0f}")
         st.dataframe(top_by_value, width="stretch")
@@ -197,7 +202,7 @@ def main():
         st.metric("Tax per Acre (avg)", f"${tax_per_acre:,.2f}")
     
     # Tax by property type
-    tax_by_type = df.groupby('property_class_desc')['annual_taxes'].sum().sort_values(ascending=False).head(8)
+    tax_by_type = df.groupby('property_class_desc', observed=True)['annual_taxes'].sum().sort_values(ascending=False).head(8)
     
     fig = px.bar(
         x=tax_by_type.index,
@@ -1,13 +1,23 @@
 """
-Owner Lookup - OPTIMIZED VERSION
+Owner Lookup - Search property portfolios by owner
 """
 
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
-import folium
-import streamlit.components.v1 as components
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pydeck as pdk
 from pathlib import Path
-import json
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_loader import ensure_parquet
+from constants import DEFAULT_DATA_FILE
 
 st.set_page_config(
     page_title="Owner Lookup | Greene County Property Finder",
@@ -15,28 +25,110 @@ st.set_page_config(
     layout="wide"
 )
 
-# Cache data in session state - load ONCE
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def load_all_data():
-    """Load parcel data once and cache it"""
-    data_path = Path(__file__).parent.parent / "data" / "zip_12450_parcels.json"
-    with open(data_path, 'r') as f:
-        data = json.load(f)
-    return pd.DataFrame(data)
-
-# Pre-compute owner stats - cached
-@st.cache_data(ttl=3600)
-def get_owner_stats(df):
-    """Pre-compute owner statistics"""
-    stats = df.groupby('owner').agg({
+# Columns used by this page - everything else stays on disk
+OWNER_COLUMNS = [
+    'owner', 'parcel_id', 'acreage', 'assessed_value', 'annual_taxes',
+    'mailing_address', 'mailing_city', 'mailing_state', 'mailing_zip',
+    'latitude', 'longitude', 'property_class_desc', 'municipality'
+]
+
+# Repeated strings stored as categoricals (integer codes for groupby/filters)
+CATEGORY_COLUMNS = ['owner', 'municipality', 'property_class_desc', 'mailing_city', 'mailing_state']
+
+DATA_PATH = Path(__file__).parent.parent / DEFAULT_DATA_FILE
+OWNER_STATS_PATH = DATA_PATH.parent / "owner_stats.parquet"
+
+
+def get_data_version(parquet_path: Path) -> str:
+    """Cheap content key for the parcel dataset (mtime + size)"""
+    stat = parquet_path.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+# Shared across sessions - load ONCE per dataset version
+@st.cache_resource(max_entries=1)
+def load_all_data(version: str):
+    """Load parcel data once from the Parquet sidecar and share it"""
+    parquet_path = ensure_parquet(DATA_PATH)
+    df = pd.read_parquet(parquet_path, columns=OWNER_COLUMNS)
+    
+    # Narrow dtypes so groupby and filtering move fewer bytes
+    df['assessed_value'] = pd.to_numeric(df['assessed_value'], downcast='integer')
+    df['annual_taxes'] = pd.to_numeric(df['annual_taxes'], downcast='float')
+    df['acreage'] = df['acreage'].astype('float32')
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype('category')
+    return df
+
+# Owner stats persisted next to the dataset - groupby runs once per version
+@st.cache_resource(max_entries=1)
+def get_owner_stats(version: str):
+    """Load owner statistics from the sidecar, recomputing if the dataset changed"""
+    if OWNER_STATS_PATH.exists():
+        try:
+            metadata = pq.read_schema(OWNER_STATS_PATH).metadata or {}
+            if metadata.get(b'source_version') == version.encode():
+                return pd.read_parquet(OWNER_STATS_PATH)
+        except (pa.ArrowException, OSError):
+            # Unreadable sidecar - recompute and overwrite it below
+            pass
+    
+    df = load_all_data(version)
+    # Widen the downcast values so per-owner totals can't overflow int32
+    df = df.assign(assessed_value=df['assessed_value'].astype('int64'))
+    stats = df.groupby('owner', observed=True).agg({
         'parcel_id': 'count',
         'acreage': 'sum',
         'assessed_value': 'sum',
         'annual_taxes': 'sum'
     }).reset_index()
     stats.columns = ['owner', 'parcel_count', 'total_acreage', 'total_value', 'total_taxes']
+    
+    table = pa.Table.from_pandas(stats, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b'source_version': version.encode()})
+    # Written beside the target and swapped in, so an interrupted write never
+    # leaves a truncated sidecar behind
+    fd, tmp_name = tempfile.mkstemp(dir=OWNER_STATS_PATH.parent, prefix=OWNER_STATS_PATH.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_name)
+        os.replace(tmp_name, OWNER_STATS_PATH)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
     return stats
 
+# Parcels indexed by owner so selecting an owner is a lookup, not a column scan
+@st.cache_resource(max_entries=1)
+def get_parcels_by_owner(version: str) -> pd.DataFrame:
+    """Parcel data indexed and sorted by owner"""
+    return load_all_data(version).set_index('owner').sort_index(kind='stable')
+
+def get_owner_parcels(version: str, owner: str) -> pd.DataFrame:
+    """All parcels belonging to one owner"""
+    return get_parcels_by_owner(version).loc[[owner]].reset_index()
+
+# Lower-cased owner names, built once so searches don't re-lower every keystroke
+@st.cache_resource(max_entries=1)
+def get_owner_search_index(version: str) -> np.ndarray:
+    """Fixed-width array of lower-cased owner names, aligned with owner stats"""
+    return get_owner_stats(version)['owner'].str.lower().to_numpy(dtype=str)
+
+# Sidebar leaderboard, rendered as one markdown block
+@st.cache_resource(max_entries=1)
+def get_top_landowners(version: str, n: int = 10) -> str:
+    """Markdown list of the n largest owners by total acreage"""
+    top = get_owner_stats(version).nlargest(n, 'total_acreage')
+    return "  \n".join(
+        f"• {owner[:25]} ({acreage:.0f} ac)"
+        for owner, acreage in zip(top['owner'].to_numpy(), top['total_acreage'].to_numpy())
+    )
+
+# CSV export encoded at most once per owner, not on every rerun
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_owner_csv(version: str, owner: str) -> bytes:
+    """CSV bytes for one owner's parcels"""
+    return get_owner_parcels(version, owner).to_csv(index=False, lineterminator='\n').encode()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -45,24 +137,17 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def main():
-    st.title("👤 Owner Lookup")
-    st.markdown("*Search property portfolios by owner*")
-    
-    # Load data ONCE
-    with st.spinner("Loading data..."):
-        df = load_all_data()
-        owner_stats = get_owner_stats(df)
-    
-    st.success(f"Loaded {len(df):,} parcels, {len(owner_stats):,} owners")
-    
+# Search/select/map region reruns alone on each keystroke
+@st.fragment
+def owner_panel(version: str, owner_stats: pd.DataFrame, owner_index: np.ndarray):
+    """Search, select and map an owner; reruns on its own without the rest of the page"""
     # Search with instant filtering
     search_query = st.text_input("🔍 Search Owner Name:", placeholder="Type to search...")
     
     # Fast filtering using pre-computed stats
     if search_query:
-        # Use vectorized string matching - much faster!
-        mask = owner_stats['owner'].str.lower().str.contains(search_query.lower(), na=False)
+        # Single C-level substring pass over the pre-lowered names
+        mask = np.char.find(owner_index, search_query.lower()) >= 0
         filtered_owners = owner_stats[mask]
     else:
         filtered_owners = owner_stats.head(100)  # Show top 100 by default
@@ -76,7 +161,7 @@ def main():
         
         if selected_owner:
             owner_info = filtered_owners[filtered_owners['owner'] == selected_owner].iloc[0]
-            owner_parcels = df[df['owner'] == selected_owner]
+            owner_parcels = get_owner_parcels(version, selected_owner)
             
             # Quick stats
             col1, col2, col3, col4 = st.columns(4)
@@ -93,33 +178,60 @@ def main():
             first = owner_parcels.iloc[0]
             st.write(f"📬 {first['mailing_address']}, {first['mailing_city']}, {first['mailing_state']} {first['mailing_zip']}")
             
-            # Simple map
+            # Simple map - deck.gl scatter, no Leaflet HTML to serialise per rerun
             if len(owner_parcels) > 0:
-                center = [owner_parcels['latitude'].mean(), owner_parcels['longitude'].mean()]
-                m = folium.Map(location=center, zoom_start=13)
+                labels = (
+                    owner_parcels['parcel_id'].astype(str) + ": $" +
+                    owner_parcels['assessed_value'].map('{:,}'.format)
+                )
+                points = owner_parcels[['latitude', 'longitude']].assign(label=labels)
                 
-                for _, row in owner_parcels.iterrows():
-                    folium.Marker(
-                        location=[row['latitude'], row['longitude']],
-                        popup=f"{row['parcel_id']}: ${row['assessed_value']:,}"
-                    ).add_to(m)
-                
-                components.html(m._repr_html_(), height=300)
+                st.pydeck_chart(pdk.Deck(
+                    layers=[pdk.Layer(
+                        "ScatterplotLayer",
+                        data=points,
+                        get_position="[longitude, latitude]",
+                        get_fill_color=[233, 69, 96, 200],
+                        get_radius=30,
+                        radius_min_pixels=4,
+                        pickable=True
+                    )],
+                    initial_view_state=pdk.ViewState(
+                        latitude=float(points['latitude'].mean()),
+                        longitude=float(points['longitude'].mean()),
+                        zoom=13
+                    ),
+                    tooltip={"text": "{label}"}
+                ), height=300)
             
             # Show parcels in expandable section
             with st.expander(f"View {len(owner_parcels)} Parcels"):
                 st.dataframe(owner_parcels[['parcel_id', 'property_class_desc', 'acreage', 'assessed_value', 'municipality']])
                 
                 # Download
-                csv = owner_parcels.to_csv(index=False)
+                csv = get_owner_csv(version, selected_owner)
                 st.download_button("📥 Download CSV", csv, f"{selected_owner[:10]}_parcels.csv", "text/csv")
+
+def main():
+    st.title("👤 Owner Lookup")
+    st.markdown("*Search property portfolios by owner*")
+    
+    # Load data ONCE
+    with st.spinner("Loading data..."):
+        version = get_data_version(ensure_parquet(DATA_PATH))
+        df = load_all_data(version)
+        owner_stats = get_owner_stats(version)
+        owner_index = get_owner_search_index(version)
+        get_parcels_by_owner(version)
+    
+    st.success(f"Loaded {len(df):,} parcels, {len(owner_stats):,} owners")
+    
+    owner_panel(version, owner_stats, owner_index)
     
     # Sidebar stats
     with st.sidebar:
         st.markdown("### Top Landowners")
-        top = owner_stats.nlargest(10, 'total_acreage')
-        for _, o in top.iterrows():
-            st.write(f"• {o['owner'][:25]} ({o['total_acreage']:.0f} ac)")
+        st.markdown(get_top_landowners(version))
 
 if __name__ == "__main__":
     main()
@@ -120,7 +120,8 @@ def filter_by_town(df: pd.DataFrame, town: str) -> pd.DataFrame:
 
 def filter_by_property_class(df: pd.DataFrame, class_prefix: str) -> pd.DataFrame:
     """Filter by property class prefix (e.g., '2' for residential)"""
-    return df[df['property_class'].str.startswith(class_prefix)]
+    from app import get_property_class_lead
+    return df[get_property_class_lead(df['property_class']) == class_prefix]
 
 
 def generate_sample_data_for_zip(zip_code: str, num_parcels: int = 50) -> pd.DataFrame:
@@ -373,23 +374,18 @@ def main():
                         # Apply filters
                         filtered = df.copy()
                         
-                        class_filters = []
+                        class_leads = []
                         if include_residential:
-                            class_filters.append(filtered['property_class'].str.startswith('2'))
+                            class_leads.append('2')
                         if include_vacant:
-                            class_filters.append(filtered['property_class'].str.startswith('3'))
+                            class_leads.append('3')
                         if include_other:
-                            class_filters.append(
-                                filtered['property_class'].str.startswith('1') |
-                                filtered['property_class'].str.startswith('4') |
-                                filtered['property_class'].str.startswith('9')
-                            )
+                            class_leads.extend(['1', '4', '9'])
                         
-                        if class_filters:
-                            combined_filter = class_filters[0]
-                            for f in class_filters[1:]:
-                                combined_filter = combined_filter | f
-                            filtered = filtered[combined_filter]
+                        if class_leads:
+                            from app import get_property_class_lead
+                            pc_lead = get_property_class_lead(filtered['property_class'])
+                            filtered = filtered[pc_lead.isin(class_leads)]
                         
                         filtered['source_zip'] = zip_code
                         all_data.append(filtered)
@@ -447,22 +443,22 @@ def main():
                     with col3:
                         # GeoJSON export
                         features = []
-                        for _, row in combined_df.iterrows():
+                        for row in combined_df.itertuples(index=False):
                             feature = {
                                 "type": "Feature",
                                 "properties": {
-                                    "parcel_id": row['parcel_id'],
-                                    "owner": row['owner'],
-                                    "acreage": row['acreage'],
-                                    "assessed_value": row['assessed_value'],
-                                    "property_class": row['property_class'],
-                                    "property_class_desc": row['property_class_desc']
+                                    "parcel_id": row.parcel_id,
+                                    "owner": row.owner,
+                                    "acreage": row.acreage,
+                                    "assessed_value": row.assessed_value,
+                                    "property_class": row.property_class,
+                                    "property_class_desc": row.property_class_desc
                                 },
                                 "geometry": {
                                     "type": "Polygon",
                                     "coordinates": [[
-                                        [coord[1], coord[0]] for coord in row['coordinates']
-                                    ] + [[row['coordinates'][0][1], row['coordinates'][0][0]]]]
+                                        [coord[1], coord[0]] for coord in row.coordinates
+                                    ] + [[row.coordinates[0][1], row.coordinates[0][0]]]]
                                 }
                             }
                             features.append(feature)
@@ -529,6 +525,9 @@ def main():
         
         col1, col2 = st.columns(2)
         
+        # Drop internal helper columns (e.g. _pc_lead) from exports
+        df = df.loc[:, ~df.columns.str.startswith('_')]
+        
         with col1:
             csv = df.to_csv(index=False)
             st.download_button(
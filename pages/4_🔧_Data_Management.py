@@ -6,9 +6,11 @@ Total Records: ~38,370 parcels
 
 import streamlit as st
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 # Add parent directory to path for imports
@@ -24,6 +26,7 @@ from greene_county_fetcher import (
     PROPERTY_CLASS_DESC
 )
 from constants import DEFAULT_DATA_FILE
+from utils.jsonio import load_file
 
 st.set_page_config(
     page_title="Data Management | Lanesville Property Finder",
@@ -66,20 +69,29 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_data(show_spinner=False)
+def count_records(path: str, mtime_ns: int, size: int) -> int:
+    """Count records in a cached data file; re-read only when the file changes"""
+    try:
+        if path.endswith(".parquet"):
+            # Row count from the footer, without reading any column data
+            return pq.ParquetFile(path).metadata.num_rows
+        data = load_file(path)
+        return len(data) if isinstance(data, list) else 0
+    except:
+        return 0
+
+
 def get_cache_info():
     """Get information about cached data files"""
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
     
     cache_files = []
-    for f in data_dir.glob("*.json"):
+    # Per-area caches and sidecars are Parquet; older caches and uploads are JSON
+    for f in sorted([*data_dir.glob("*.json"), *data_dir.glob("*.parquet")]):
         stat = f.stat()
-        try:
-            with open(f, "r") as file:
-                data = json.load(file)
-                record_count = len(data) if isinstance(data, list) else 0
-        except:
-            record_count = 0
+        record_count = count_records(str(f), stat.st_mtime_ns, stat.st_size)
             
         cache_files.append({
             "filename": f.name,
@@ -92,6 +104,21 @@ def get_cache_info():
     return cache_files
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def check_api_status():
+    """Get total record count and municipality list in parallel (cached 5 min)"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        count_future = executor.submit(get_record_count)
+        munis_future = executor.submit(get_available_municipalities)
+        return count_future.result(), munis_future.result()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_area_count(municipality: str) -> int:
+    """Get record count for a municipality (cached 5 min)"""
+    return get_record_count(municipality)
+
+
 def main():
     st.title("🔧 Data Management")
     st.markdown("*Fetch real parcel data from Greene County ArcGIS*")
@@ -104,9 +131,9 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Get current record count from API
+    # Get current record count and municipalities from API
     with st.spinner("Checking API..."):
-        api_count = get_record_count()
+        api_count, municipalities = check_api_status()
     
     if api_count > 0:
         st.success(f"✅ API Online - **{api_count:,}** parcels available")
@@ -125,10 +152,6 @@ def main():
         You can download **all parcels** or filter by **municipality**.
         """)
         
-        # Get available municipalities
-        with st.spinner("Loading municipalities..."):
-            municipalities = get_available_municipalities()
-        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -156,9 +179,9 @@ def main():
             # Get count for selected area
             with st.spinner("Getting record count..."):
                 if municipality:
-                    area_count = get_record_count(municipality)
+                    area_count = get_area_count(municipality)
                 else:
-                    area_count = get_record_count()
+                    area_count = api_count
             
             st.info(f"📊 **{area_count:,}** parcels available" + (f" in {municipality}" if municipality else ""))
         
@@ -319,13 +342,12 @@ def main():
                     if selected_file:
                         file_path = Path("data") / selected_file
                         if file_path.exists():
-                            with open(file_path, "r") as f:
-                                data = f.read()
+                            is_parquet = file_path.suffix == ".parquet"
                             st.download_button(
-                                "📥 Download JSON",
-                                data=data,
+                                "📥 Download Parquet" if is_parquet else "📥 Download JSON",
+                                data=file_path.read_bytes(),
                                 file_name=selected_file,
-                                mime="application/json"
+                                mime="application/vnd.apache.parquet" if is_parquet else "application/json"
                             )
         else:
             st.info("No cached data files found. Use the 'Fetch Data' tab to download data.")
@@ -22,7 +22,7 @@ if requirements_path.exists():
     ]
 else:
     requirements = [
-        "streamlit>=1.31.0",
+        "streamlit>=1.37.0",
         "pandas>=2.0.0",
         "folium>=0.15.0",
         "streamlit-folium>=0.18.0",
@@ -58,11 +58,19 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "orjson>=3.8.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
             "pre-commit>=3.0.0",
         ],
+        "speedups": [
+            "orjson>=3.8.0",
+            "requests-cache>=1.0.0",
+            "ijson>=3.1.0",
+            "zstandard>=0.21.0",
+            "xxhash>=3.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
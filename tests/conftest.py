@@ -3,22 +3,16 @@ Pytest configuration and shared fixtures
 """
 
 import pytest
-import pandas as pd
 import json
-from pathlib import Path
-import tempfile
-import shutil
 
 
 @pytest.fixture(scope="session")
-def temp_data_dir():
+def temp_data_dir(tmp_path_factory):
     """Create a temporary data directory for tests"""
-    temp_dir = tempfile.mkdtemp(prefix="test_data_")
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return tmp_path_factory.mktemp("test_data")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_parcel_data():
     """Sample parcel data for testing"""
     return [
@@ -94,22 +88,25 @@ def sample_parcel_data():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe(sample_parcel_data):
     """Sample DataFrame for testing"""
+    import pandas as pd
     return pd.DataFrame(sample_parcel_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_file(temp_data_dir, sample_parcel_data):
-    """Create a sample JSON file with parcel data"""
+    """Create a sample JSON file with parcel data (written once per session)"""
     file_path = temp_data_dir / "test_parcels.json"
-    with open(file_path, "w") as f:
-        json.dump(sample_parcel_data, f)
+    file_path.write_text(json.dumps(sample_parcel_data))
     return file_path
 
 
-@pytest.fixture
+# Session scope: the mock responses are only read by tests (process_features
+# and the patched fetch never mutate them), so one instance is shared. A test
+# that needs to modify a response should copy.deepcopy it first.
+@pytest.fixture(scope="session")
 def mock_api_response():
     """Mock API response from Greene County ArcGIS"""
     return {
@@ -144,6 +141,37 @@ def mock_api_response():
     }
 
 
+@pytest.fixture(scope="session")
+def mock_api_response_large():
+    """Synthetic 1,000-feature ArcGIS response for load tests (built once per session)"""
+    return {
+        "features": [
+            {
+                "attributes": {
+                    "OBJECTID": i,
+                    "PRINT_KEY": f"86.{i // 100}-1-{i % 100}",
+                    "OWNER": f"Owner {i % 250}",
+                    "PROP_CLASS": ("210", "311", "931", "260")[i % 4],
+                    "ACRES": 1.0 + (i % 50),
+                    "TOTAL_AV": 50000 + 1000 * i,
+                    "LAND_AV": 25000,
+                    "MUNI_NAME": ("Hunter", "Jewett", "Lexington")[i % 3]
+                },
+                "geometry": {
+                    "rings": [[
+                        [-74.284 - 0.001 * (i % 40), 42.185 + 0.001 * (i // 40)],
+                        [-74.283 - 0.001 * (i % 40), 42.185 + 0.001 * (i // 40)],
+                        [-74.283 - 0.001 * (i % 40), 42.186 + 0.001 * (i // 40)],
+                        [-74.284 - 0.001 * (i % 40), 42.186 + 0.001 * (i // 40)],
+                        [-74.284 - 0.001 * (i % 40), 42.185 + 0.001 * (i // 40)]
+                    ]]
+                }
+            }
+            for i in range(1000)
+        ]
+    }
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers"""
@@ -4,6 +4,7 @@ Tests for app.py main application
 
 import pytest
 import pandas as pd
+import numpy as np
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -41,11 +42,10 @@ class TestDataLoading:
         """Test that coordinates are in correct format"""
         df = sample_dataframe
         
-        for idx, row in df.iterrows():
-            coords = row['coordinates']
-            assert isinstance(coords, list), "Coordinates should be a list"
-            if len(coords) > 0:
-                assert len(coords[0]) == 2, "Each coordinate should be [lat, lon]"
+        valid = df['coordinates'].map(
+            lambda c: isinstance(c, (list, np.ndarray)) and (len(c) == 0 or len(c[0]) == 2)
+        )
+        assert valid.all(), "Coordinates should be lists of [lat, lon] pairs"
 
 
 class TestPropertyClassification:
@@ -54,29 +54,29 @@ class TestPropertyClassification:
     @pytest.mark.unit
     def test_property_class_color_mapping(self):
         """Test that property classes map to colors correctly"""
-        # Color mapping logic (from app.py)
-        def get_color(prop_class):
-            prop_class = str(prop_class)
-            if prop_class.startswith('2'):
-                return 'green'  # Residential
-            elif prop_class.startswith('3'):
-                return 'yellow'  # Vacant
-            elif prop_class.startswith('9'):
-                return 'blue'  # State/Forest
-            elif prop_class.startswith('1'):
-                return 'lightgreen'  # Agricultural
-            elif prop_class.startswith('4'):
-                return 'orange'  # Commercial
-            elif prop_class.startswith('5'):
-                return 'purple'  # Recreation
-            else:
-                return 'gray'
-        
-        assert get_color('210') == 'green'
-        assert get_color('311') == 'yellow'
-        assert get_color('931') == 'blue'
-        assert get_color('120') == 'lightgreen'
-        assert get_color('421') == 'orange'
+        from app import PARCEL_COLORS, DEFAULT_PARCEL_COLOR, get_parcel_colors, get_property_class_lead
+        
+        classes = pd.Series(['210', '311', '931', '', '710'])
+        colors = get_parcel_colors(get_property_class_lead(classes))
+        
+        assert colors.tolist() == [
+            PARCEL_COLORS['2'],
+            PARCEL_COLORS['3'],
+            PARCEL_COLORS['9'],
+            DEFAULT_PARCEL_COLOR,
+            DEFAULT_PARCEL_COLOR,
+        ]
+    
+    @pytest.mark.unit
+    def test_ui_property_colors(self):
+        """Test ui's scalar and vectorized color lookups agree"""
+        from ui import get_property_color, get_property_colors
+        
+        classes = pd.Series(['210', '311', '931', '120', '421', '552', '710', ''])
+        expected = ['green', 'yellow', 'blue', 'lightgreen', 'orange', 'purple', 'gray', 'gray']
+        
+        assert [get_property_color(pc) for pc in classes] == expected
+        assert get_property_colors(classes).tolist() == expected
 
 
 class TestFiltering:
@@ -92,6 +92,31 @@ class TestFiltering:
         assert len(filtered) > 0
         assert all(search_term.lower() in owner.lower() for owner in filtered['owner'])
     
+    @pytest.mark.unit
+    def test_apply_filters_search(self, sample_dataframe):
+        """Test the sidebar search matches owner or parcel ID, ignoring case"""
+        from ui import apply_filters, use_arrow_strings
+        
+        df = use_arrow_strings(sample_dataframe)
+        assert str(df['owner'].dtype) == 'string'
+        
+        assert apply_filters(df, {'search': 'smith'})['parcel_id'].tolist() == ['86.1-1-1']
+        assert apply_filters(df, {'search': '1-1-3'})['owner'].tolist() == ['Mountain View LLC']
+        # Literal match - regex metacharacters are not special
+        assert apply_filters(df, {'search': 'smith, j('}).empty
+    
+    @pytest.mark.unit
+    def test_apply_filters_search_sidecars(self, sample_dataframe):
+        """Test searching the lowercased sidecar columns matches the plain search"""
+        from ui import apply_filters, prepare_search_columns
+        
+        df = prepare_search_columns(sample_dataframe)
+        assert df['_owner_lc'].tolist() == ['smith, john', 'nys dec', 'mountain view llc']
+        
+        for search in ('SMITH', 'dec', '1-1-3', 'smith, j('):
+            assert (apply_filters(df, {'search': search})['parcel_id'].tolist()
+                    == apply_filters(sample_dataframe, {'search': search})['parcel_id'].tolist())
+    
     @pytest.mark.unit
     def test_filter_by_acreage_range(self, sample_dataframe):
         """Test filtering by acreage range"""
@@ -108,10 +133,21 @@ class TestFiltering:
         """Test filtering by property class"""
         df = sample_dataframe
         
-        # Filter for residential (starts with 2)
-        residential = df[df['property_class'].astype(str).str.startswith('2')]
-        for pc in residential['property_class']:
-            assert str(pc).startswith('2')
+        from app import get_property_class_lead
+        
+        # Filter for residential (starts with 2) on the categorical lead digit
+        pc_lead = get_property_class_lead(df['property_class'])
+        assert isinstance(pc_lead.dtype, pd.CategoricalDtype)
+        residential = df[pc_lead == '2']
+        assert residential['property_class'].tolist() == ['210']
+    
+    @pytest.mark.unit
+    def test_property_class_lead_empty_class(self):
+        """Test that an empty class gets an empty lead instead of raising"""
+        from app import get_property_class_lead
+        
+        leads = get_property_class_lead(pd.Series(['210', '', '931']))
+        assert leads.tolist() == ['2', '', '9']
     
     @pytest.mark.unit
     def test_filter_by_municipality(self, sample_dataframe):
@@ -205,19 +241,15 @@ class TestExport:
     @pytest.mark.unit
     def test_json_export(self, sample_dataframe, temp_data_dir):
         """Test JSON export"""
-        import json
+        import orjson
         
         export_path = temp_data_dir / "export.json"
-        records = sample_dataframe.to_dict(orient='records')
-        
-        with open(export_path, 'w') as f:
-            json.dump(records, f)
+        sample_dataframe.to_json(export_path, orient='records')
         
         assert export_path.exists()
         
         # Reload and verify
-        with open(export_path) as f:
-            reloaded = json.load(f)
+        reloaded = orjson.loads(export_path.read_bytes())
         
         assert len(reloaded) == len(sample_dataframe)
 
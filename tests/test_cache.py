@@ -0,0 +1,102 @@
+"""
+Tests for utils/cache.py
+"""
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.cache import file_cache, get_cache_key
+
+
+class TestFileCache:
+    """Tests for the file_cache decorator"""
+    
+    @pytest.mark.unit
+    def test_equal_values_of_different_types_cache_separately(self, tmp_path):
+        """Test that f(1), f(True) and f(1.0) each compute their own result"""
+        calls = []
+        
+        @file_cache(cache_dir=tmp_path)
+        def describe(value):
+            calls.append(value)
+            return type(value).__name__
+        
+        assert describe(1) == "int"
+        assert describe(True) == "bool"
+        assert describe(1.0) == "float"
+        assert describe(1) == "int"
+        assert describe(value=True) == "bool"
+        assert describe(value=1.0) == "float"
+        
+        assert [type(v) for v in calls] == [int, bool, float, bool, float]
+    
+    @pytest.mark.unit
+    def test_repeat_call_uses_cache(self, tmp_path):
+        """Test that a repeated call is served from disk"""
+        calls = []
+        
+        @file_cache(cache_dir=tmp_path)
+        def double(values):
+            calls.append(values)
+            return [v * 2 for v in values]
+        
+        assert double([1, 2]) == [2, 4]
+        assert double([1, 2]) == [2, 4]
+        assert len(calls) == 1
+    
+    @pytest.mark.unit
+    def test_unpicklable_arguments(self, tmp_path):
+        """Test that unpicklable arguments (e.g. a callback) still get a key"""
+        calls = []
+        
+        @file_cache(cache_dir=tmp_path)
+        def fetch(area, cb=None):
+            calls.append(area)
+            return [area]
+        
+        callback = lambda m: None
+        assert fetch("Hunter", cb=callback) == ["Hunter"]
+        assert fetch("Hunter", cb=callback) == ["Hunter"]
+        assert calls == ["Hunter"]
+    
+    @pytest.mark.unit
+    def test_cache_key_distinguishes_types(self):
+        """Test that the key itself differs for equal values of different types"""
+        assert len({get_cache_key("f", 1), get_cache_key("f", True), get_cache_key("f", 1.0)}) == 3
+    
+    @pytest.mark.unit
+    def test_use_arrow_round_trips_dataframes(self, tmp_path):
+        """Test that use_arrow stores DataFrames as Feather and keeps their dtypes"""
+        import pandas as pd
+        calls = []
+        
+        @file_cache(cache_dir=tmp_path, use_arrow=True)
+        def load():
+            calls.append(1)
+            return pd.DataFrame({"acreage": pd.Series([1.5, 2.0], dtype="float32")})
+        
+        first = load()
+        second = load()
+        
+        assert len(calls) == 1
+        assert second["acreage"].dtype == "float32"
+        assert second.equals(first)
+        assert [p.suffix for p in tmp_path.iterdir()] == [".feather"]
+    
+    @pytest.mark.unit
+    def test_use_arrow_caches_other_results_as_json(self, tmp_path):
+        """Test that use_arrow falls back to JSON for results that aren't DataFrames"""
+        calls = []
+        
+        @file_cache(cache_dir=tmp_path, use_arrow=True)
+        def summary():
+            calls.append(1)
+            return {"parcels": 3}
+        
+        assert summary() == {"parcels": 3}
+        assert summary() == {"parcels": 3}
+        assert len(calls) == 1
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
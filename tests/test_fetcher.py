@@ -3,7 +3,9 @@ Tests for greene_county_fetcher.py
 """
 
 import pytest
-import json
+import io
+import numpy as np
+import orjson
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -16,9 +18,11 @@ from greene_county_fetcher import (
     get_available_municipalities,
     fetch_all_parcels,
     process_features,
+    iter_page_features,
     save_to_file,
     load_from_file,
     fetch_greene_county_data,
+    cache_is_fresh,
     GREENE_COUNTY_API,
     PROPERTY_CLASS_DESC
 )
@@ -81,6 +85,8 @@ class TestProcessFeatures:
         # Should have coordinates
         assert "coordinates" in df.columns
         assert len(df.iloc[0]["coordinates"]) > 0
+        assert df.iloc[0]["coordinates"].dtype == np.float32
+        assert df.iloc[0]["coordinates"][0].tolist() == pytest.approx([42.185, -74.284])
         
         # Should have calculated centroid
         assert df.iloc[0]["latitude"] is not None
@@ -92,6 +98,27 @@ class TestProcessFeatures:
         df = process_features([])
         assert len(df) == 0
     
+    @pytest.mark.unit
+    def test_process_features_numeric_text_attributes(self, mock_api_response):
+        """Test that numeric codes in text attributes are kept as strings instead of raising"""
+        feature = mock_api_response["features"][0]
+        feature = {**feature, "attributes": {**feature["attributes"], "SCHOOL_DIST": 192401, "MUNI_NAME": 1234}}
+        
+        df = process_features([feature])
+        
+        assert df["school_district"].tolist() == ["192401"]
+        assert df["municipality"].tolist() == ["1234"]
+    
+    @pytest.mark.unit
+    def test_process_features_large(self, mock_api_response_large):
+        """Test processing a full page of features"""
+        df = process_features(mock_api_response_large["features"])
+        
+        assert len(df) == 1000
+        assert df["owner"].nunique() == 250
+        assert df["latitude"].between(42.18, 42.22).all()
+        assert df["longitude"].between(-74.33, -74.28).all()
+    
     @pytest.mark.unit
     def test_property_class_mapping(self):
         """Test property class descriptions are available"""
@@ -101,6 +128,30 @@ class TestProcessFeatures:
         assert "Forest" in PROPERTY_CLASS_DESC["931"]
 
 
+class TestIterPageFeatures:
+    """Tests for streaming features out of a query response"""
+    
+    @pytest.mark.unit
+    def test_streams_features(self, mock_api_response):
+        """Test that features are yielded one at a time from the raw body"""
+        pytest.importorskip("ijson")
+        body = io.BytesIO(orjson.dumps({**mock_api_response, "exceededTransferLimit": True}))
+        
+        features = iter_page_features(body)
+        
+        assert next(features)["attributes"] == mock_api_response["features"][0]["attributes"]
+        assert list(features) == []
+    
+    @pytest.mark.unit
+    def test_error_body_raises(self):
+        """Test that an ArcGIS error body raises instead of reading as an empty page"""
+        pytest.importorskip("ijson")
+        body = io.BytesIO(orjson.dumps({"error": {"code": 400, "message": "Invalid query"}}))
+        
+        with pytest.raises(ValueError, match="Invalid query"):
+            list(iter_page_features(body))
+
+
 class TestFileOperations:
     """Tests for file save/load operations"""
     
@@ -121,8 +172,7 @@ class TestFileOperations:
             assert saved_file.exists()
             
             # Load and verify
-            with open(saved_file) as f:
-                loaded = json.load(f)
+            loaded = orjson.loads(saved_file.read_bytes())
             
             assert len(loaded) == len(sample_dataframe)
     
@@ -139,20 +189,30 @@ class TestFetchAllParcels:
     @pytest.mark.unit
     def test_fetch_with_mock(self, mock_api_response):
         """Test fetch with mocked API response"""
-        with patch('greene_county_fetcher.requests.get') as mock_get:
+        with patch('greene_county_fetcher._SESSION.get') as mock_get:
             # Mock count response
             count_response = MagicMock()
             count_response.json.return_value = {"count": 1}
             count_response.status_code = 200
             count_response.raise_for_status = MagicMock()
             
+            # Mock layer metadata response (used to build outFields)
+            layer_response = MagicMock()
+            layer_response.json.return_value = {
+                "fields": [{"name": name} for name in mock_api_response["features"][0]["attributes"]]
+            }
+            layer_response.status_code = 200
+            layer_response.raise_for_status = MagicMock()
+            
             # Mock data response
             data_response = MagicMock()
             data_response.json.return_value = mock_api_response
+            data_response.raw = io.BytesIO(orjson.dumps(mock_api_response))
             data_response.status_code = 200
             data_response.raise_for_status = MagicMock()
+            data_response.__enter__.return_value = data_response
             
-            mock_get.side_effect = [count_response, data_response]
+            mock_get.side_effect = [count_response, layer_response, data_response]
             
             progress_messages = []
             def capture_progress(msg):
@@ -164,7 +224,39 @@ class TestFetchAllParcels:
             )
             
             assert df is not None
-            assert len(df) >= 0
+            assert len(df) == 1
+            
+            # Page query asks only for known attribute fields
+            out_fields = mock_get.call_args_list[2].kwargs["params"]["outFields"]
+            assert "PRINT_KEY" in out_fields.split(",")
+            assert "OBJECTID" in out_fields.split(",")
+    
+    @pytest.mark.unit
+    def test_fetch_reports_api_error(self, mock_api_response):
+        """Test that an error body returned with HTTP 200 is reported, not treated as empty"""
+        error_body = {"error": {"code": 400, "message": "Invalid query"}}
+        with patch('greene_county_fetcher._SESSION.get') as mock_get:
+            count_response = MagicMock()
+            count_response.json.return_value = {"count": 1}
+            
+            layer_response = MagicMock()
+            layer_response.json.return_value = {
+                "fields": [{"name": name} for name in mock_api_response["features"][0]["attributes"]]
+            }
+            
+            data_response = MagicMock()
+            data_response.json.return_value = error_body
+            data_response.raw = io.BytesIO(orjson.dumps(error_body))
+            data_response.__enter__.return_value = data_response
+            
+            mock_get.side_effect = [count_response, layer_response, data_response]
+            
+            progress_messages = []
+            df = fetch_all_parcels(progress_callback=progress_messages.append, max_records=1)
+            
+            assert df is None
+            assert "API Error: Invalid query" in progress_messages
+            data_response.__exit__.assert_called_once()
     
     @pytest.mark.integration
     @pytest.mark.slow
@@ -184,16 +276,38 @@ class TestFetchGreeneCountyData:
     def test_fetch_uses_cache(self, temp_data_dir, sample_json_file):
         """Test that cached data is used when available"""
         with patch('greene_county_fetcher.load_from_file') as mock_load:
-            import pandas as pd
-            mock_load.return_value = pd.DataFrame([{"test": "data"}])
-            
-            progress_messages = []
-            result = fetch_greene_county_data(
-                use_cache=True,
-                progress_callback=lambda m: progress_messages.append(m)
-            )
-            
-            mock_load.assert_called()
+            with patch('greene_county_fetcher.cache_is_fresh', return_value=True):
+                import pandas as pd
+                mock_load.return_value = pd.DataFrame([{"test": "data"}])
+                
+                progress_messages = []
+                result = fetch_greene_county_data(
+                    use_cache=True,
+                    progress_callback=lambda m: progress_messages.append(m)
+                )
+                
+                mock_load.assert_called()
+    
+    @pytest.mark.unit
+    def test_cache_is_fresh(self, sample_json_file):
+        """Test the cache freshness check"""
+        assert cache_is_fresh(sample_json_file)
+        assert cache_is_fresh(sample_json_file, max_age=3600)
+        assert not cache_is_fresh(sample_json_file, max_age=0)
+        assert not cache_is_fresh(sample_json_file.with_name("missing.json"))
+    
+    @pytest.mark.unit
+    def test_fetch_skips_stale_cache(self):
+        """Test that a stale cache is refetched without being loaded"""
+        with patch('greene_county_fetcher.fetch_all_parcels') as mock_fetch:
+            with patch('greene_county_fetcher.load_from_file') as mock_load:
+                with patch('greene_county_fetcher.cache_is_fresh', return_value=False):
+                    mock_fetch.return_value = None
+                    
+                    fetch_greene_county_data(use_cache=True, max_age=60)
+                    
+                    mock_load.assert_not_called()
+                    mock_fetch.assert_called()
     
     @pytest.mark.unit
     def test_fetch_skips_cache(self):
@@ -0,0 +1,35 @@
+"""
+Tests for utils/jsonio.py
+"""
+
+import math
+import json
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.jsonio import loads, load_file
+
+
+class TestLoads:
+    """Tests for JSON parsing"""
+    
+    @pytest.mark.unit
+    def test_loads_bare_nan(self, tmp_path):
+        """Test that NaN written by json.dump for missing floats still parses"""
+        records = [{"parcel_id": "1", "latitude": float("nan"), "longitude": 42.1}]
+        path = tmp_path / "cache.json"
+        with open(path, "w") as f:
+            json.dump(records, f)
+        
+        for parsed in (loads(path.read_bytes()), load_file(path)):
+            assert math.isnan(parsed[0]["latitude"])
+            assert parsed[0]["longitude"] == 42.1
+    
+    @pytest.mark.unit
+    def test_loads_invalid_json_raises(self):
+        """Test that malformed input still raises a JSON decode error"""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"count": ')
@@ -3,12 +3,21 @@ UI Components for Greene County Property Finder
 Reusable Streamlit UI elements and styling
 """
 
+import re
+from collections import ChainMap
+
 import streamlit as st
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+# Columns matched by the sidebar search box
+SEARCH_COLUMNS = ('owner', 'parcel_id')
 
-def apply_custom_css():
-    """Apply custom CSS styling to the app"""
-    st.markdown("""
+
+# App-wide styles, with comments and indentation stripped once at import so
+# every rerun sends the smallest payload
+_CUSTOM_CSS = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", """
     <style>
         /* Main app background */
         .stApp {
@@ -110,7 +119,13 @@ def apply_custom_css():
             color: #e94560;
         }
     </style>
-    """, unsafe_allow_html=True)
+""")).strip()
+
+
+def apply_custom_css():
+    """Apply custom CSS styling to the app"""
+    # Sent on every rerun: Streamlit drops elements a rerun doesn't emit
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 
 def render_header(title: str, subtitle: str = None, icon: str = "🗺️"):
@@ -131,18 +146,41 @@ def render_stat_card(label: str, value: str, icon: str = "📊"):
     """, unsafe_allow_html=True)
 
 
-def render_property_card(parcel: dict):
-    """Render a property information card"""
-    st.markdown(f"""
+# Property card markup, filled from a parcel dict with _CARD_DEFAULTS for
+# missing fields
+_CARD_TEMPLATE = """
     <div class="property-card">
-        <h4>{parcel.get('owner', 'Unknown Owner')}</h4>
-        <p><strong>Parcel ID:</strong> {parcel.get('parcel_id', 'N/A')}</p>
-        <p><strong>Type:</strong> {parcel.get('property_class_desc', 'Unknown')}</p>
-        <p><strong>Acreage:</strong> {parcel.get('acreage', 0):.2f} acres</p>
-        <p><strong>Assessed Value:</strong> ${parcel.get('assessed_value', 0):,.0f}</p>
-        <p><strong>Municipality:</strong> {parcel.get('municipality', 'N/A')}</p>
+        <h4>{owner}</h4>
+        <p><strong>Parcel ID:</strong> {parcel_id}</p>
+        <p><strong>Type:</strong> {property_class_desc}</p>
+        <p><strong>Acreage:</strong> {acreage:.2f} acres</p>
+        <p><strong>Assessed Value:</strong> ${assessed_value:,.0f}</p>
+        <p><strong>Municipality:</strong> {municipality}</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+_CARD_DEFAULTS = {
+    'owner': 'Unknown Owner',
+    'parcel_id': 'N/A',
+    'property_class_desc': 'Unknown',
+    'acreage': 0,
+    'assessed_value': 0,
+    'municipality': 'N/A',
+}
+
+
+def _property_card_html(parcel: dict) -> str:
+    """Fill the property card template for one parcel"""
+    return _CARD_TEMPLATE.format_map(ChainMap(parcel, _CARD_DEFAULTS))
+
+
+def render_property_card(parcel: dict):
+    """Render a property information card"""
+    st.markdown(_property_card_html(parcel), unsafe_allow_html=True)
+
+
+def render_property_cards(parcels: list):
+    """Render a list of property cards in a single markdown element"""
+    st.markdown("".join(map(_property_card_html, parcels)), unsafe_allow_html=True)
 
 
 def render_info_box(content: str, box_type: str = "info"):
@@ -162,32 +200,54 @@ def render_metrics_row(metrics: list):
     Args:
         metrics: List of dicts with 'label', 'value', and optional 'delta'
     """
-    cols = st.columns(len(metrics))
-    for col, metric in zip(cols, metrics):
-        with col:
-            if 'delta' in metric:
-                st.metric(
-                    label=metric['label'],
-                    value=metric['value'],
-                    delta=metric['delta']
-                )
-            else:
-                st.metric(
-                    label=metric['label'],
-                    value=metric['value']
-                )
-
-
-def render_sidebar_filters(df):
+    # Write to each column directly rather than entering it as a context
+    for col, metric in zip(st.columns(len(metrics)), metrics):
+        col.metric(label=metric['label'], value=metric['value'], delta=metric.get('delta'))
+
+
+@st.cache_data(show_spinner=False)
+def _filter_options(data_key, _df) -> dict:
+    """
+    Choices and slider bounds for the sidebar filters
+    
+    Computed once per dataset; _df is not hashed by Streamlit, data_key
+    identifies the dataset instead.
+    """
+    options = {}
+    if 'property_class_desc' in _df.columns:
+        options['prop_types'] = ['All'] + sorted(_df['property_class_desc'].dropna().unique().tolist())
+    if 'acreage' in _df.columns:
+        options['max_acres'] = float(min(_df['acreage'].max(), 500))
+    if 'assessed_value' in _df.columns:
+        options['max_value'] = int(min(_df['assessed_value'].max(), 5000000))
+    if 'municipality' in _df.columns:
+        options['munis'] = ['All'] + sorted(_df['municipality'].dropna().unique().tolist())
+    return options
+
+
+def render_sidebar_filters(df, data_key=None):
     """
     Render common sidebar filters
     
     Args:
         df: DataFrame with parcel data
+        data_key: Hashable identifier of the dataset (e.g. a file mtime); the
+            filter options are cached on it. Defaults to the loader's
+            df.attrs['data_version'] plus the row count, or a hash of the
+            index when the frame has no version.
         
     Returns:
         Dictionary of filter values
     """
+    if data_key is None:
+        version = df.attrs.get('data_version')
+        if version is not None:
+            # O(1) key; the row count tells a filtered frame (which inherits
+            # attrs) apart from the full dataset
+            data_key = (version, len(df))
+        else:
+            data_key = (len(df), int(pd.util.hash_pandas_object(df.index).sum()), tuple(df.columns))
+    options = _filter_options(data_key, df)
     filters = {}
     
     with st.sidebar:
@@ -200,13 +260,12 @@ def render_sidebar_filters(df):
         )
         
         # Property type
-        if 'property_class_desc' in df.columns:
-            prop_types = ['All'] + sorted(df['property_class_desc'].dropna().unique().tolist())
-            filters['property_type'] = st.selectbox("Property Type:", prop_types)
+        if 'prop_types' in options:
+            filters['property_type'] = st.selectbox("Property Type:", options['prop_types'])
         
         # Acreage range
-        if 'acreage' in df.columns:
-            max_acres = min(df['acreage'].max(), 500)
+        if 'max_acres' in options:
+            max_acres = options['max_acres']
             filters['acreage_range'] = st.slider(
                 "Acreage Range:",
                 0.0,
@@ -215,8 +274,8 @@ def render_sidebar_filters(df):
             )
         
         # Value range
-        if 'assessed_value' in df.columns:
-            max_value = min(df['assessed_value'].max(), 5000000)
+        if 'max_value' in options:
+            max_value = options['max_value']
             filters['value_range'] = st.slider(
                 "Assessed Value:",
                 0,
@@ -227,79 +286,160 @@ def render_sidebar_filters(df):
             )
         
         # Municipality
-        if 'municipality' in df.columns:
-            munis = ['All'] + sorted(df['municipality'].dropna().unique().tolist())
-            filters['municipality'] = st.selectbox("Municipality:", munis)
+        if 'munis' in options:
+            filters['municipality'] = st.selectbox("Municipality:", options['munis'])
     
     return filters
 
 
+def use_arrow_strings(df, columns=SEARCH_COLUMNS):
+    """
+    Store text columns as Arrow-backed strings
+    
+    Call once when the data is loaded so each search hands apply_filters'
+    Arrow kernel the column buffers without a per-keystroke conversion.
+    
+    Args:
+        df: DataFrame with parcel data
+        columns: Columns to convert (missing ones are skipped)
+        
+    Returns:
+        DataFrame with the columns as string[pyarrow]
+    """
+    return df.astype({col: 'string[pyarrow]' for col in columns if col in df.columns})
+
+
+def prepare_search_columns(df, columns=SEARCH_COLUMNS):
+    """
+    Add lowercased copies of text columns for case-insensitive search
+    
+    Call once when the data is loaded (inside its st.cache_data loader);
+    each column gets an internal `_<column>_lc` sidecar so searches match
+    pre-lowered text instead of case-folding every value per keystroke.
+    
+    Args:
+        df: DataFrame with parcel data
+        columns: Columns to index (missing ones are skipped)
+        
+    Returns:
+        DataFrame with the `_<column>_lc` columns added
+    """
+    return df.assign(**{
+        f'_{col}_lc': df[col].astype('string[pyarrow]').str.lower()
+        for col in columns if col in df.columns
+    })
+
+
+def contains_text(series, text: str, ignore_case: bool = True):
+    """
+    Literal substring match over a text column
+    
+    Runs Arrow's match_substring kernel on the UTF-8 buffers instead of
+    building a lowercased copy of every value; missing values never match.
+    Pass ignore_case=False with a lowered text to search a column from
+    prepare_search_columns, which skips the per-value case folding.
+    
+    Returns:
+        Boolean NumPy array aligned with series
+    """
+    values = pa.array(series, from_pandas=True)
+    if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        values = values.cast(pa.large_string())  # e.g. an empty object column
+    matches = pc.match_substring(values, text, ignore_case=ignore_case)
+    return pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+
+
+def _covers(values, low, high) -> bool:
+    """True if every value lies within [low, high], i.e. a range filter would keep all rows"""
+    return not values.hasnans and values.min() >= low and values.max() <= high
+
+
+def _in_range(values, low, high):
+    """Boolean NumPy mask of low <= values <= high (NaN never matches)"""
+    if values.dtype.kind in 'iuf':
+        # Compare the NumPy buffer directly, skipping Series construction
+        # and index handling for the two intermediate masks
+        arr = values.to_numpy()
+        mask = arr >= low
+        mask &= arr <= high
+        return mask
+    return values.between(low, high).to_numpy()
+
+
 def apply_filters(df, filters: dict):
     """
     Apply filters to DataFrame
     
+    Filters left at their defaults ('All', or a range spanning every value)
+    are skipped, and the rest are combined into a single mask, so an
+    unfiltered rerun returns df itself without copying it.
+    
     Args:
         df: DataFrame to filter
         filters: Dictionary of filter values from render_sidebar_filters
         
     Returns:
-        Filtered DataFrame
+        Filtered DataFrame (df itself when nothing is filtered - copy it
+        before modifying)
     """
-    filtered = df.copy()
+    mask = None
+    
+    def narrow(sub_mask):
+        nonlocal mask
+        mask = sub_mask if mask is None else mask & sub_mask
     
-    # Search filter
+    # Search filter (on the lowercased sidecars when prepare_search_columns ran)
     if filters.get('search'):
-        search = filters['search'].lower()
-        mask = (
-            filtered['owner'].str.lower().str.contains(search, na=False) |
-            filtered['parcel_id'].str.lower().str.contains(search, na=False)
-        )
-        filtered = filtered[mask]
+        search = filters['search']
+        if '_owner_lc' in df.columns and '_parcel_id_lc' in df.columns:
+            search = search.lower()
+            narrow(contains_text(df['_owner_lc'], search, ignore_case=False)
+                   | contains_text(df['_parcel_id_lc'], search, ignore_case=False))
+        else:
+            narrow(contains_text(df['owner'], search) | contains_text(df['parcel_id'], search))
     
     # Property type filter
     if filters.get('property_type') and filters['property_type'] != 'All':
-        filtered = filtered[filtered['property_class_desc'] == filters['property_type']]
+        narrow((df['property_class_desc'] == filters['property_type']).to_numpy())
     
     # Acreage filter
     if filters.get('acreage_range'):
         min_acres, max_acres = filters['acreage_range']
-        filtered = filtered[
-            (filtered['acreage'] >= min_acres) & 
-            (filtered['acreage'] <= max_acres)
-        ]
+        if not _covers(df['acreage'], min_acres, max_acres):
+            narrow(_in_range(df['acreage'], min_acres, max_acres))
     
     # Value filter
     if filters.get('value_range'):
         min_val, max_val = filters['value_range']
-        filtered = filtered[
-            (filtered['assessed_value'] >= min_val) & 
-            (filtered['assessed_value'] <= max_val)
-        ]
+        if not _covers(df['assessed_value'], min_val, max_val):
+            narrow(_in_range(df['assessed_value'], min_val, max_val))
     
     # Municipality filter
     if filters.get('municipality') and filters['municipality'] != 'All':
-        filtered = filtered[filtered['municipality'] == filters['municipality']]
+        narrow((df['municipality'] == filters['municipality']).to_numpy())
     
-    return filtered
+    return df if mask is None else df[mask]
+
+
+# Map color keyed on the leading digit of the property class
+_COLOR_BY_LEAD = {
+    '2': 'green',       # Residential
+    '3': 'yellow',      # Vacant
+    '9': 'blue',        # State/Forest
+    '1': 'lightgreen',  # Agricultural
+    '4': 'orange',      # Commercial
+    '5': 'purple',      # Recreation
+    '6': 'gray',        # Community Service
+}
+DEFAULT_PROPERTY_COLOR = 'gray'  # Other
 
 
 def get_property_color(property_class: str) -> str:
     """Get color for a property class"""
-    property_class = str(property_class)
-    
-    if property_class.startswith('2'):
-        return 'green'      # Residential
-    elif property_class.startswith('3'):
-        return 'yellow'     # Vacant
-    elif property_class.startswith('9'):
-        return 'blue'       # State/Forest
-    elif property_class.startswith('1'):
-        return 'lightgreen' # Agricultural
-    elif property_class.startswith('4'):
-        return 'orange'     # Commercial
-    elif property_class.startswith('5'):
-        return 'purple'     # Recreation
-    elif property_class.startswith('6'):
-        return 'gray'       # Community Service
-    else:
-        return 'gray'       # Other
+    return _COLOR_BY_LEAD.get(str(property_class)[:1], DEFAULT_PROPERTY_COLOR)
+
+
+def get_property_colors(property_classes):
+    """Get colors for a Series of property classes in one vectorized pass"""
+    leading = property_classes.astype(str).str[:1]
+    return leading.map(_COLOR_BY_LEAD).fillna(DEFAULT_PROPERTY_COLOR).to_numpy()
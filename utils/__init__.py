@@ -5,11 +5,14 @@ Includes:
 - logger: Logging configuration
 - cache: File-based caching utilities
 - config: Configuration management
+- http: Shared HTTP session with keep-alive and retries
+- jsonio: JSON parsing with optional orjson acceleration
 """
 
 from .logger import setup_logger, get_logger
 from .cache import file_cache, clear_cache
 from .config import Config, get_config
+from .http import create_session
 
 __all__ = [
     'setup_logger',
@@ -17,5 +20,6 @@ __all__ = [
     'file_cache',
     'clear_cache',
     'Config',
-    'get_config'
+    'get_config',
+    'create_session'
 ]
@@ -15,35 +15,68 @@ import json
 import pickle
 from pathlib import Path
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Optional, Union
 import os
+import time
+
+from utils.jsonio import dumps, loads
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 # Default cache directory
 CACHE_DIR = Path(os.environ.get("CACHE_DIR", "data/.cache"))
 
+# Argument types whose (type, value) pairs identify a cache key exactly, so
+# file_cache can memoize the key for them
+_MEMO_KEY_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
+
+# Errors that mean a cache file is unreadable and should be regenerated
+# (JSON and Arrow decode errors are ValueErrors; EOFError is a truncated pickle)
+_CORRUPT_CACHE_ERRORS = (ValueError, EOFError, pickle.PickleError)
+if zstandard is not None:
+    _CORRUPT_CACHE_ERRORS += (zstandard.ZstdError,)
+
 
 def get_cache_key(*args, **kwargs) -> str:
     """
     Generate a cache key from function arguments
     
+    The arguments are pickled (a C-level walk, unlike json.dumps) and hashed
+    with xxHash-64 when installed (pip install .[speedups]), MD5 otherwise.
+    Arguments that can't be pickled (lambdas, open files) are keyed by
+    json.dumps(default=str) instead.
+    
     Args:
         *args: Positional arguments
         **kwargs: Keyword arguments
         
     Returns:
-        MD5 hash string
+        Hex digest string
     """
-    # Create a string representation of the arguments
-    key_data = json.dumps([args, kwargs], sort_keys=True, default=str)
-    return hashlib.md5(key_data.encode()).hexdigest()
+    try:
+        key_data = pickle.dumps((args, sorted(kwargs.items())), protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        key_data = json.dumps([args, kwargs], sort_keys=True, default=str).encode()
+    if xxhash is not None:
+        return xxhash.xxh64_hexdigest(key_data)
+    return hashlib.md5(key_data).hexdigest()
 
 
 def file_cache(
     expiry_hours: int = 24,
     cache_dir: Optional[Path] = None,
-    use_pickle: bool = False
+    use_pickle: bool = False,
+    use_arrow: bool = False
 ):
     """
     Decorator to cache function results to disk
@@ -51,7 +84,12 @@ def file_cache(
     Args:
         expiry_hours: How long to keep cached results (in hours)
         cache_dir: Directory to store cache files
-        use_pickle: Use pickle instead of JSON (for complex objects)
+        use_pickle: Use pickle instead of JSON (for complex objects); written
+            with the highest protocol and zstd-compressed when zstandard is
+            installed (pip install .[speedups])
+        use_arrow: Store DataFrame results as Arrow IPC (Feather) files,
+            which keep column types and load far faster than JSON or pickle;
+            other results use the JSON (or use_pickle) format
         
     Returns:
         Decorated function
@@ -62,48 +100,107 @@ def file_cache(
             return api_call(municipality)
     """
     cache_path = cache_dir or CACHE_DIR
+    # Plain strings and os.stat keep the cache-hit path free of Path objects
+    cache_dir_str = str(cache_path)
+    expiry_seconds = expiry_hours * 3600
+    ext = ".pkl" if use_pickle else ".json"
+    # Compressed pickles get their own extension so a cache written with
+    # zstandard installed is never read back as a plain pickle
+    compress = use_pickle and zstandard is not None
+    if compress:
+        ext = ".pkl.zst"
     
     def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        
+        # Reruns with the same scalar arguments reuse the digest instead of
+        # pickling and hashing them again. Each value is paired with its type
+        # because 1, True and 1.0 are equal (and hash alike) but must not
+        # share a cache entry.
+        @lru_cache(maxsize=1024)
+        def memo_key(typed_args: tuple, typed_kwargs: tuple) -> str:
+            return get_cache_key(
+                name,
+                *(value for _, value in typed_args),
+                **{key: value for key, (_, value) in typed_kwargs}
+            )
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache directory
-            cache_path.mkdir(parents=True, exist_ok=True)
-            
             # Generate cache key
-            key = get_cache_key(func.__name__, *args, **kwargs)
-            ext = ".pkl" if use_pickle else ".json"
-            cache_file = cache_path / f"{func.__name__}_{key}{ext}"
+            if all(type(a) in _MEMO_KEY_TYPES for a in args) and \
+                    all(type(v) in _MEMO_KEY_TYPES for v in kwargs.values()):
+                key = memo_key(
+                    tuple((type(a), a) for a in args),
+                    tuple((k, (type(v), v)) for k, v in sorted(kwargs.items()))
+                )
+            else:
+                # Containers and objects: nested values could compare equal
+                # across types, so always hash them in full
+                key = get_cache_key(name, *args, **kwargs)
+            cache_base = os.path.join(cache_dir_str, f"{name}_{key}")
             
-            # Check if cache exists and is valid
-            if cache_file.exists():
-                stat = cache_file.stat()
-                age = datetime.now() - datetime.fromtimestamp(stat.st_mtime)
+            # With use_arrow the result may be in either file, depending on
+            # whether it was a DataFrame; each candidate costs one stat call
+            candidates = [(cache_base + ".feather", True)] if use_arrow else []
+            candidates.append((cache_base + ext, False))
+            
+            for cache_file, as_arrow in candidates:
+                try:
+                    mtime = os.stat(cache_file).st_mtime
+                except FileNotFoundError:
+                    continue
+                if time.time() - mtime >= expiry_seconds:
+                    continue
                 
-                if age < timedelta(hours=expiry_hours):
-                    # Cache hit - load and return
-                    try:
-                        if use_pickle:
-                            with open(cache_file, 'rb') as f:
-                                return pickle.load(f)
-                        else:
-                            with open(cache_file, 'r') as f:
-                                return json.load(f)
-                    except (json.JSONDecodeError, pickle.PickleError):
-                        # Cache corrupted, will regenerate
-                        pass
+                # Cache hit - load and return
+                try:
+                    if as_arrow:
+                        # Memory-map the IPC file so column buffers are
+                        # served from the OS page cache instead of a copy
+                        import pyarrow as pa
+                        with pa.memory_map(cache_file, 'r') as source:
+                            table = pa.ipc.open_file(source).read_all()
+                        return table.to_pandas()
+                    elif compress:
+                        with open(cache_file, 'rb') as f, zstandard.ZstdDecompressor().stream_reader(f) as r:
+                            return pickle.load(r)
+                    elif use_pickle:
+                        with open(cache_file, 'rb') as f:
+                            return pickle.load(f)
+                    else:
+                        with open(cache_file, 'rb') as f:
+                            return loads(f.read())
+                except _CORRUPT_CACHE_ERRORS:
+                    # Cache corrupted, will regenerate
+                    pass
             
             # Cache miss - execute function
             result = func(*args, **kwargs)
             
-            # Save to cache
+            as_arrow = False
+            if use_arrow:
+                import pandas as pd
+                as_arrow = isinstance(result, pd.DataFrame)
+            cache_file = cache_base + (".feather" if as_arrow else ext)
+            
+            # Save to cache (the directory is only created on a miss)
             try:
-                if use_pickle:
+                os.makedirs(cache_dir_str, exist_ok=True)
+                if as_arrow:
+                    from pyarrow import feather
+                    # Uncompressed, so reads can map the buffers directly
+                    feather.write_feather(result, cache_file, compression='uncompressed')
+                elif compress:
+                    with open(cache_file, 'wb') as f, zstandard.ZstdCompressor(level=1).stream_writer(f) as w:
+                        pickle.dump(result, w, protocol=pickle.HIGHEST_PROTOCOL)
+                elif use_pickle:
                     with open(cache_file, 'wb') as f:
-                        pickle.dump(result, f)
+                        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
                 else:
-                    with open(cache_file, 'w') as f:
-                        json.dump(result, f, default=str)
-            except (TypeError, pickle.PickleError) as e:
+                    with open(cache_file, 'wb') as f:
+                        f.write(dumps(result))
+            except (TypeError, ValueError, pickle.PickleError) as e:
                 # If caching fails, just return the result
                 print(f"Warning: Could not cache result: {e}")
             
@@ -118,6 +215,22 @@ def file_cache(
     return decorator
 
 
+def _scan_files(cache_dir: Path):
+    """
+    Yield a DirEntry for each file in cache_dir (nothing if it's missing)
+    
+    One readdir pass; DirEntry.is_file() and, on most platforms, stat()
+    reuse what the directory listing returned instead of a syscall per file.
+    """
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
 def clear_function_cache(func_name: str, cache_dir: Path = CACHE_DIR) -> int:
     """
     Clear cache files for a specific function
@@ -129,10 +242,11 @@ def clear_function_cache(func_name: str, cache_dir: Path = CACHE_DIR) -> int:
     Returns:
         Number of files deleted
     """
+    prefix = f"{func_name}_"
     count = 0
-    if cache_dir.exists():
-        for cache_file in cache_dir.glob(f"{func_name}_*"):
-            cache_file.unlink()
+    for entry in _scan_files(cache_dir):
+        if entry.name.startswith(prefix):
+            os.unlink(entry.path)
             count += 1
     return count
 
@@ -148,11 +262,9 @@ def clear_cache(cache_dir: Path = CACHE_DIR) -> int:
         Number of files deleted
     """
     count = 0
-    if cache_dir.exists():
-        for cache_file in cache_dir.glob("*"):
-            if cache_file.is_file():
-                cache_file.unlink()
-                count += 1
+    for entry in _scan_files(cache_dir):
+        os.unlink(entry.path)
+        count += 1
     return count
 
 
@@ -174,20 +286,17 @@ def get_cache_info(func_name: Optional[str] = None, cache_dir: Path = CACHE_DIR)
         "files": []
     }
     
-    if not cache_dir.exists():
-        return info
-    
-    pattern = f"{func_name}_*" if func_name else "*"
+    prefix = f"{func_name}_" if func_name else ""
+    now = time.time()
     
-    for cache_file in cache_dir.glob(pattern):
-        if cache_file.is_file():
-            stat = cache_file.stat()
-            age = datetime.now() - datetime.fromtimestamp(stat.st_mtime)
+    for entry in _scan_files(cache_dir):
+        if entry.name.startswith(prefix):
+            stat = entry.stat()
             
             info["files"].append({
-                "name": cache_file.name,
+                "name": entry.name,
                 "size_kb": stat.st_size / 1024,
-                "age_hours": age.total_seconds() / 3600,
+                "age_hours": (now - stat.st_mtime) / 3600,
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
             })
             
@@ -209,15 +318,12 @@ def cleanup_expired_cache(expiry_hours: int = 24, cache_dir: Path = CACHE_DIR) -
         Number of files deleted
     """
     count = 0
-    if cache_dir.exists():
-        for cache_file in cache_dir.glob("*"):
-            if cache_file.is_file():
-                stat = cache_file.stat()
-                age = datetime.now() - datetime.fromtimestamp(stat.st_mtime)
-                
-                if age > timedelta(hours=expiry_hours):
-                    cache_file.unlink()
-                    count += 1
+    # Files last modified before the cutoff have expired
+    cutoff = time.time() - expiry_hours * 3600
+    for entry in _scan_files(cache_dir):
+        if entry.stat().st_mtime < cutoff:
+            os.unlink(entry.path)
+            count += 1
     return count
 
 
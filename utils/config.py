@@ -12,48 +12,59 @@ Usage:
 """
 
 import os
+import re
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List
 import json
 
 
+# One KEY=value assignment per line; blank lines, comments and lines
+# without "=" don't match. Key and value have surrounding blanks trimmed.
+_DOTENV_LINE = re.compile(r'^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+
+
+@lru_cache(maxsize=4)
+def _parse_dotenv(env_file: str, mtime_ns: int) -> Dict[str, str]:
+    """Parse a .env file (cached per path and modification time)"""
+    text = Path(env_file).read_text()
+    env_vars = {}
+    for key, value in _DOTENV_LINE.findall(text):
+        # Remove quotes
+        if value[:1] in ('"', "'") and value.endswith(value[0]):
+            value = value[1:-1]
+        env_vars[key] = value
+    return env_vars
+
+
 def load_dotenv(env_file: Path = Path(".env")) -> dict:
     """
     Load environment variables from .env file
     
+    The file is parsed once and reused until it is modified.
+    
     Args:
         env_file: Path to .env file
         
     Returns:
         Dictionary of environment variables
     """
-    env_vars = {}
-    
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse key=value
-                if '=' in line:
-                    key, _, value = line.partition('=')
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    env_vars[key] = value
+    try:
+        mtime_ns = os.stat(env_file).st_mtime_ns
+    except OSError:
+        return {}
     
-    return env_vars
+    return dict(_parse_dotenv(str(env_file), mtime_ns))
+
+
+# Environment strings -> field values, keyed by the field's annotation
+_CASTS = {
+    str: str,
+    int: int,
+    float: float,
+    bool: lambda value: value.lower() == "true",
+}
 
 
 @dataclass
@@ -119,36 +130,13 @@ class Config:
                         os.environ.setdefault(key, value)
                     break
         
-        # Build config from environment
-        return cls(
-            GREENE_COUNTY_API_URL=os.environ.get("GREENE_COUNTY_API_URL", cls.GREENE_COUNTY_API_URL),
-            BATCH_SIZE=int(os.environ.get("BATCH_SIZE", cls.BATCH_SIZE)),
-            REQUEST_TIMEOUT=int(os.environ.get("REQUEST_TIMEOUT", cls.REQUEST_TIMEOUT)),
-            MAX_REQUESTS_PER_MINUTE=int(os.environ.get("MAX_REQUESTS_PER_MINUTE", cls.MAX_REQUESTS_PER_MINUTE)),
-            
-            DEFAULT_MUNICIPALITY=os.environ.get("DEFAULT_MUNICIPALITY", cls.DEFAULT_MUNICIPALITY),
-            DEFAULT_MAP_STYLE=os.environ.get("DEFAULT_MAP_STYLE", cls.DEFAULT_MAP_STYLE),
-            SHOW_LABELS_DEFAULT=os.environ.get("SHOW_LABELS_DEFAULT", "false").lower() == "true",
-            DEFAULT_SAMPLE_PARCELS=int(os.environ.get("DEFAULT_SAMPLE_PARCELS", cls.DEFAULT_SAMPLE_PARCELS)),
-            
-            CACHE_EXPIRY_DAYS=int(os.environ.get("CACHE_EXPIRY_DAYS", cls.CACHE_EXPIRY_DAYS)),
-            CACHE_DIR=os.environ.get("CACHE_DIR", cls.CACHE_DIR),
-            AUTO_REFRESH_CACHE=os.environ.get("AUTO_REFRESH_CACHE", "false").lower() == "true",
-            
-            LOG_LEVEL=os.environ.get("LOG_LEVEL", cls.LOG_LEVEL),
-            LOG_TO_FILE=os.environ.get("LOG_TO_FILE", "false").lower() == "true",
-            LOG_FILE_PATH=os.environ.get("LOG_FILE_PATH", cls.LOG_FILE_PATH),
-            
-            ENABLE_API_FETCH=os.environ.get("ENABLE_API_FETCH", "true").lower() == "true",
-            ENABLE_ANALYTICS=os.environ.get("ENABLE_ANALYTICS", "true").lower() == "true",
-            ENABLE_EXPORT=os.environ.get("ENABLE_EXPORT", "true").lower() == "true",
-            ENABLE_DRAWING_TOOLS=os.environ.get("ENABLE_DRAWING_TOOLS", "true").lower() == "true",
-            
-            DEFAULT_LAT=float(os.environ.get("DEFAULT_LAT", cls.DEFAULT_LAT)),
-            DEFAULT_LON=float(os.environ.get("DEFAULT_LON", cls.DEFAULT_LON)),
-            DEFAULT_ZOOM=int(os.environ.get("DEFAULT_ZOOM", cls.DEFAULT_ZOOM)),
-            MAX_MAP_PARCELS=int(os.environ.get("MAX_MAP_PARCELS", cls.MAX_MAP_PARCELS)),
-        )
+        # Build config from environment, casting by each field's type
+        environ = os.environ
+        kwargs = {}
+        for name, f in cls.__dataclass_fields__.items():
+            value = environ.get(name)
+            kwargs[name] = f.default if value is None else _CASTS[f.type](value)
+        return cls(**kwargs)
     
     def to_dict(self) -> dict:
         """Convert config to dictionary"""
@@ -0,0 +1,77 @@
+"""
+HTTP session utilities for Greene County Property Finder
+
+Responses are cached in SQLite when requests-cache is installed
+(pip install .[speedups]) and a cache name is given.
+
+Usage:
+    from utils.http import create_session
+
+    session = create_session(cache_name="data/http_cache")
+    response = session.get(url, params=params, timeout=30)
+"""
+
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+# Transient ArcGIS gateway errors worth retrying
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+def create_session(
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    pool_maxsize: int = 10,
+    cache_name: Optional[str] = None,
+    expire_after: int = 3600
+) -> requests.Session:
+    """
+    Create a keep-alive session with gzip and retries
+
+    Reusing one session keeps the TCP/TLS connection to the GIS server
+    open across requests instead of handshaking on every call.
+
+    Args:
+        retries: Number of retries for connection errors and 502/503/504
+        backoff_factor: Exponential backoff factor between retries
+        pool_maxsize: Maximum connections kept open per host
+        cache_name: SQLite cache path for GET responses; ignored when
+            requests-cache is not installed
+        expire_after: Seconds before a cached response is refetched
+
+    Returns:
+        Configured requests.Session
+    """
+    if cache_name and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name,
+            backend="sqlite",
+            expire_after=expire_after,
+            cache_control=True,
+            allowable_methods=("GET",)
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
@@ -0,0 +1,156 @@
+"""
+JSON parsing utilities for Greene County Property Finder
+
+Uses orjson and ijson when installed (pip install .[speedups]) and falls
+back to the standard library otherwise. Files ending in .zst are
+decompressed on the fly with zstandard.
+
+Usage:
+    from utils.jsonio import dumps, loads, load_file, load_columns
+
+    data = loads(response.content)
+    payload = dumps({"count": 3})
+    records = load_file("data/zip_12450_parcels.json")
+    columns = load_columns("data/zip_12450_parcels.json", ["owner", "acreage"])
+"""
+
+import json
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: Raw JSON bytes (e.g. response.content) or text
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the bare NaN/Infinity tokens json.dump writes for
+            # missing floats (e.g. caches from before orjson); json accepts them
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes
+    
+    Values JSON can't represent are written with str(), as with
+    json.dumps(default=str); orjson also serializes NumPy arrays natively.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, default=str).encode()
+
+
+def open_json(path: Union[str, Path]) -> BinaryIO:
+    """
+    Open a JSON file for binary reading, decompressing .zst files
+
+    Args:
+        path: Path to a .json or .json.zst file
+
+    Returns:
+        Binary file-like object
+
+    Raises:
+        ImportError: If the file is zstd-compressed and zstandard is missing
+    """
+    path = Path(path)
+    f = open(path, "rb")
+    if path.suffix != ".zst":
+        return f
+    if zstandard is None:
+        f.close()
+        raise ImportError(f"zstandard is required to read {path} (pip install zstandard)")
+    return zstandard.ZstdDecompressor().stream_reader(f, closefd=True)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file, reading it as bytes to skip the text decode step
+
+    Args:
+        path: Path to a .json or .json.zst file
+
+    Returns:
+        Parsed Python object
+    """
+    with open_json(path) as f:
+        return loads(f.read())
+
+
+def load_columns(path: Union[str, Path], columns: Optional[List[str]] = None) -> Dict[str, list]:
+    """
+    Read a JSON array of records into one list per column
+
+    With ijson the file is streamed record by record (using its C backend
+    when available), so the full list of dicts is never held in memory.
+
+    Args:
+        path: Path to a .json or .json.zst file containing a list of objects
+        columns: Keys to keep; all keys when None
+
+    Returns:
+        Dict of column name -> list of values, padded with None where a
+        record lacks a key
+    """
+    cols = {col: [] for col in columns} if columns else {}
+    count = 0
+
+    if ijson is not None:
+        f = open_json(path)
+        records = ijson.items(f, "item", use_float=True)
+    else:
+        f = None
+        records = load_file(path)
+
+    try:
+        for record in records:
+            for key, value in record.items():
+                if key in cols:
+                    cols[key].append(value)
+                elif columns is None:
+                    cols[key] = [None] * count + [value]
+            count += 1
+            for values in cols.values():
+                if len(values) < count:
+                    values.append(None)
+    finally:
+        if f is not None:
+            f.close()
+
+    return cols
@@ -1,6 +1,10 @@
 """
 Logging utilities for Greene County Property Finder
 
+Loggers only put records on a queue; a background listener thread does the
+formatting and console/file writes. Logging calls are therefore safe from
+asyncio coroutines and never block the event loop on I/O.
+
 Usage:
     from utils.logger import get_logger
     
@@ -9,19 +13,37 @@ Usage:
     logger.error("Something went wrong", exc_info=True)
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
 import os
 
 
+# Top-level logger that get_logger() configures; module loggers are its children
+APP_LOGGER = "property_finder"
+
 # Log format constants
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DETAILED_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
 SIMPLE_FORMAT = "%(levelname)s: %(message)s"
 
+# Console timestamps are time-of-day only (no date or milliseconds); the log
+# file keeps the full default timestamp
+CONSOLE_DATE_FORMAT = "%H:%M:%S"
+
+# None of the formats above use thread or process fields, so skip collecting
+# them (current_thread(), getpid(), ...) for every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Color codes for terminal output
 COLORS = {
     'DEBUG': '\033[36m',     # Cyan
@@ -33,45 +55,222 @@ COLORS = {
 }
 
 
+# Checked once per process rather than per formatter
+_STDOUT_ISATTY = sys.stdout.isatty()
+
+# Log directories already created by setup_logger in this process
+_ensured_dirs: Set[Path] = set()
+
+# One queue and one listener thread serve every configured logger. Queue
+# items are (record, handlers) pairs, so each logger keeps its own handlers.
+_log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_listener: Optional["_RoutingQueueListener"] = None
+_listener_lock = threading.Lock()
+
+# Handlers currently attached (via the queue) to each configured logger,
+# and the setup_logger arguments that built them
+_configured_handlers: Dict[str, Tuple[logging.Handler, ...]] = {}
+_configured_args: Dict[str, tuple] = {}
+
+
+def _close_handlers(handlers) -> None:
+    """Flush and close handlers"""
+    for handler in handlers:
+        # MemoryHandler.close flushes but leaves its target open
+        target = getattr(handler, 'target', None)
+        handler.flush()
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+def _ensure_listener() -> None:
+    """Start the shared listener thread if it isn't running"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = _RoutingQueueListener(_log_queue)
+            _listener.start()
+
+
+def _stop_listeners() -> None:
+    """Drain the queue, stop the listener and close all handlers (registered with atexit)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+    while _configured_handlers:
+        _, handlers = _configured_handlers.popitem()
+        _close_handlers(handlers)
+
+
+atexit.register(_stop_listeners)
+
+
 class ColoredFormatter(logging.Formatter):
     """Formatter that adds colors to log output for terminals"""
     
-    def __init__(self, fmt: str = DEFAULT_FORMAT, use_colors: bool = True):
-        super().__init__(fmt)
-        self.use_colors = use_colors and sys.stdout.isatty()
+    def __init__(self, fmt: str = DEFAULT_FORMAT, use_colors: bool = True, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self.use_colors = use_colors and _STDOUT_ISATTY
+        # Colored level names, built once and indexed by levelno (None for
+        # non-standard levels)
+        colored = [None] * (logging.CRITICAL + 1)
+        for level, color in COLORS.items():
+            if level != 'RESET':
+                colored[getattr(logging, level)] = f"{color}{level}{COLORS['RESET']}"
+        self._colored = tuple(colored)
+        # Colors are decided once here: without them, format is the plain
+        # Formatter.format with no per-record check
+        if not self.use_colors:
+            self.format = super().format
     
     def format(self, record: logging.LogRecord) -> str:
-        if self.use_colors:
-            color = COLORS.get(record.levelname, COLORS['RESET'])
-            reset = COLORS['RESET']
-            record.levelname = f"{color}{record.levelname}{reset}"
-        return super().format(record)
+        # Color the level name only while formatting; other handlers share
+        # the record and must not see the ANSI codes
+        levelname = record.levelname
+        try:
+            colored = self._colored[record.levelno]
+        except IndexError:
+            colored = None
+        if colored is None:
+            colored = f"{COLORS['RESET']}{levelname}{COLORS['RESET']}"
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+class _LocklessQueueHandler(QueueHandler):
+    """
+    QueueHandler that tags records with their handlers and skips the lock
+    
+    emit() only copies the record and puts it on a SimpleQueue, which is
+    already thread-safe, so the RLock Handler.handle takes around it is
+    pure overhead on the calling thread. (Setting lock = None instead
+    breaks on Python 3.13+, where handle() uses 'with self.lock'.)
+    """
+    
+    def __init__(self, log_queue, handlers: Tuple[logging.Handler, ...]):
+        super().__init__(log_queue)
+        self.handlers = handlers
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait((record, self.handlers))
+    
+    def handle(self, record: logging.LogRecord):
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+
+class _RoutingQueueListener(QueueListener):
+    """
+    QueueListener for (record, handlers) items from every configured logger
+    
+    A (None, handlers) item closes those handlers once the records queued
+    ahead of it have been written (used when a logger is reconfigured).
+    """
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue, respect_handler_level=True)
+    
+    def handle(self, item) -> None:
+        record, handlers = item
+        if record is None:
+            _close_handlers(handlers)
+            return
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that lets the stream's own buffer batch writes
+    
+    StreamHandler flushes after every record, which defeats the block
+    buffering Python gives stdout when it isn't a terminal. This only
+    flushes for records at flush_level or above and every flush_every
+    records, so routine output goes out in large writes.
+    """
+    
+    def __init__(self, stream=None, flush_level: int = logging.WARNING, flush_every: int = 100):
+        super().__init__(stream)
+        self.flush_level = flush_level
+        self.flush_every = flush_every
+        self._unflushed = 0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._unflushed += 1
+            if record.levelno >= self.flush_level or self._unflushed >= self.flush_every:
+                self.flush()
+                self._unflushed = 0
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logger(
-    name: str = "property_finder",
+    name: str = APP_LOGGER,
     level: str = "INFO",
     log_file: Optional[str] = None,
     log_to_console: bool = True,
-    use_colors: bool = True
+    use_colors: bool = True,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    buffer_capacity: int = 1024
 ) -> logging.Logger:
     """
     Set up and configure a logger
     
+    The logger itself only gets a QueueHandler; console and file output
+    happen on the background listener thread shared by all loggers, so
+    logging calls never block on a write.
+    
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to write logs
         log_to_console: Whether to output to console
         use_colors: Whether to use colored output in console
+        max_bytes: Rotate the log file at this size, keeping backup_count
+            old files (0 leaves rotation to an external tool like logrotate)
+        backup_count: Number of rotated log files to keep
+        buffer_capacity: File records buffered in memory and written in
+            one batch; ERROR and above flush immediately (0 writes each
+            record as it arrives)
         
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     
-    # Clear existing handlers
+    # Same configuration as last time: keep the handlers (and open files)
+    args = (level, log_file, log_to_console, use_colors, max_bytes, backup_count, buffer_capacity)
+    if _configured_args.get(name) == args and name in _configured_handlers and logger.handlers:
+        return logger
+    _configured_args[name] = args
+    
+    # Clear existing handlers; the previous ones are closed on the listener
+    # thread after the records already queued for them
     logger.handlers = []
+    old_handlers = _configured_handlers.pop(name, None)
+    if old_handlers is not None:
+        if _listener is not None:
+            _log_queue.put((None, old_handlers))
+        else:
+            _close_handlers(old_handlers)
+    
+    handlers = []
     
     # Set level from string
     level_num = getattr(logging, level.upper(), logging.INFO)
@@ -79,20 +278,49 @@ def setup_logger(
     
     # Console handler
     if log_to_console:
-        console_handler = logging.StreamHandler(sys.stdout)
+        # Interactive terminals see every line immediately; piped output
+        # is batched
+        if _STDOUT_ISATTY:
+            console_handler = logging.StreamHandler(sys.stdout)
+        else:
+            console_handler = BufferedStreamHandler(sys.stdout)
         console_handler.setLevel(level_num)
-        console_handler.setFormatter(ColoredFormatter(DEFAULT_FORMAT, use_colors))
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(ColoredFormatter(DEFAULT_FORMAT, use_colors, CONSOLE_DATE_FORMAT))
+        handlers.append(console_handler)
     
     # File handler
     if log_file:
         log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        if log_path.parent not in _ensured_dirs:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(log_path.parent)
         
-        file_handler = logging.FileHandler(log_path)
+        if max_bytes > 0:
+            file_handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backup_count)
+        else:
+            # Keeps the file open, reopening only if logrotate moved it away
+            file_handler = WatchedFileHandler(log_path)
         file_handler.setLevel(level_num)
         file_handler.setFormatter(logging.Formatter(DETAILED_FORMAT))
-        logger.addHandler(file_handler)
+        
+        # Batch records into fewer, larger writes
+        if buffer_capacity > 0:
+            file_handler = MemoryHandler(
+                buffer_capacity,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
+            )
+            file_handler.setLevel(level_num)
+        handlers.append(file_handler)
+    
+    # Route records through the shared queue to the listener thread that owns
+    # the handlers; only the lock-free queue handler runs on the calling thread
+    if handlers:
+        handlers = tuple(handlers)
+        _configured_handlers[name] = handlers
+        logger.addHandler(_LocklessQueueHandler(_log_queue, handlers))
+        _ensure_listener()
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -100,54 +328,84 @@ def setup_logger(
     return logger
 
 
-def get_logger(name: str = "property_finder") -> logging.Logger:
+@lru_cache(maxsize=None)
+def _get_logger_cached(name: str) -> logging.Logger:
+    """Fetch a logger under the app logger, configuring that once; memoized per name"""
+    app_logger = logging.getLogger(APP_LOGGER)
+    
+    # If the app logger has no handlers, set up defaults. The environment is
+    # read here (once, thanks to the cache) rather than at import, so values
+    # that get_config() loads from .env after import still apply.
+    if not app_logger.handlers:
+        level = os.environ.get("LOG_LEVEL", "INFO")
+        log_file = os.environ.get("LOG_FILE_PATH")
+        setup_logger(APP_LOGGER, level, log_file)
+    
+    if name == APP_LOGGER or name.startswith(APP_LOGGER + "."):
+        return logging.getLogger(name)
+    # Module loggers live under the app logger and propagate to its handlers
+    return logging.getLogger(f"{APP_LOGGER}.{name}")
+
+
+def get_logger(name: str = APP_LOGGER) -> logging.Logger:
     """
     Get or create a logger with the given name
     
+    Module loggers are created as children of the app logger
+    ("property_finder.<name>") with no handlers of their own, so every
+    module shares one configured set of handlers and one listener thread.
+    Loggers are singletons, so the instance is cached per name and repeat
+    calls skip logging's manager lock and the handler check.
+    
     Args:
         name: Logger name (typically __name__)
         
     Returns:
         Logger instance
     """
-    logger = logging.getLogger(name)
-    
-    # If logger has no handlers, set up defaults
-    if not logger.handlers:
-        level = os.environ.get("LOG_LEVEL", "INFO")
-        log_file = os.environ.get("LOG_FILE_PATH")
-        setup_logger(name, level, log_file)
-    
-    return logger
+    return _get_logger_cached(name)
 
 
 class LogContext:
-    """Context manager for logging operations with timing"""
+    """
+    Context manager for logging operations with timing
+    
+    Logs one "Completed" (or "Failed") record with the duration on exit;
+    pass emit_start=True to also log a "Starting" record on entry.
+    """
     
-    def __init__(self, logger: logging.Logger, operation: str, level: int = logging.INFO):
+    def __init__(self, logger: logging.Logger, operation: str, level: int = logging.INFO,
+                 emit_start: bool = False):
         self.logger = logger
         self.operation = operation
         self.level = level
-        self.start_time = None
+        self.emit_start = emit_start
+        self.start_ns = None
+        # Checked once; when the level is disabled only failures are logged
+        self._enabled = logger.isEnabledFor(level)
     
     def __enter__(self):
-        self.start_time = datetime.now()
-        self.logger.log(self.level, f"Starting: {self.operation}")
+        self.start_ns = time.perf_counter_ns()
+        if self._enabled and self.emit_start:
+            self.logger.log(self.level, "Starting: %s", self.operation)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self.start_time).total_seconds()
+        if exc_type is None and not self._enabled:
+            return False
+        
+        duration = (time.perf_counter_ns() - self.start_ns) / 1e9
         
         if exc_type is None:
-            self.logger.log(self.level, f"Completed: {self.operation} ({duration:.2f}s)")
+            self.logger.log(self.level, "Completed: %s (%.2fs)", self.operation, duration)
         else:
-            self.logger.error(f"Failed: {self.operation} ({duration:.2f}s) - {exc_val}")
+            self.logger.error("Failed: %s (%.2fs) - %s", self.operation, duration, exc_val)
         
         return False  # Don't suppress exceptions
 
 
 # Convenience function for timed operations
-def log_operation(logger: logging.Logger, operation: str):
+def log_operation(logger: logging.Logger, operation: str, emit_start: bool = False):
     """
     Decorator/context manager for logging operations with timing
     
@@ -155,7 +413,7 @@ def log_operation(logger: logging.Logger, operation: str):
         with log_operation(logger, "Fetching data"):
             fetch_data()
     """
-    return LogContext(logger, operation)
+    return LogContext(logger, operation, emit_start=emit_start)
 
 
 # Example usage
@@ -170,6 +428,5 @@ if __name__ == "__main__":
     logger.critical("This is a critical message")
     
     with log_operation(logger, "Demo operation"):
-        import time
         time.sleep(0.5)
         print("Doing work...")